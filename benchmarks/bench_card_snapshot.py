@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Memory held by the weekly sync for scanned cards: raw dicts vs. CardSnapshot.
+
+Measures with tracemalloc the retained size of 10k cards kept as `fields=all`
+dicts, as dicts of the sync's projected scan fields, and as slotted
+CardSnapshot records with interned labels.
+
+    python benchmarks/bench_card_snapshot.py [--cards 10000]
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+from bench_field_projection import fake_id, full_card, project  # noqa: E402
+from weekly_milestone_sync import SCAN_CARD_FIELDS  # noqa: E402
+from weekly_sync.card_snapshot import CardSnapshot  # noqa: E402
+
+
+def retained(build, raw: bytes) -> int:
+    """Bytes still allocated after building the cards from a fresh JSON decode"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    cards = build(json.loads(raw))
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del cards
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cards", type=int, default=10000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    board_id = fake_id(rng)
+    labels = [{"id": fake_id(rng), "idBoard": board_id, "name": name, "color": color}
+              for name, color in [("This Week", "orange"), ("Bug", "red"), ("Feature", "green")]]
+    cards = [full_card(rng, board_id, labels) for _ in range(args.cards)]
+
+    representations = {
+        "fields=all dicts": (cards, lambda cards: cards),
+        "scan-field dicts": ([project(card, SCAN_CARD_FIELDS) for card in cards], lambda cards: cards),
+        "CardSnapshot": (
+            [project(card, SCAN_CARD_FIELDS) for card in cards],
+            lambda cards: [CardSnapshot.from_api(card) for card in cards],
+        ),
+    }
+    print(f"{args.cards} cards held in memory")
+    baseline = None
+    for label, (payload, build) in representations.items():
+        size = retained(build, json.dumps(payload).encode())
+        baseline = baseline or size
+        print(f"  {label:<18} {size / 1024 / 1024:7.2f} MiB   {size / args.cards:7.0f} B/card   ({size / baseline:5.1%})")
+
+
+if __name__ == "__main__":
+    main()
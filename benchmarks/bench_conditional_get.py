@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Repeated reads of a large card list with and without conditional GETs.
+
+Serves a synthetic list of cards from the local mock Trello server, which tags
+GET responses with an ETag, and reads it repeatedly through TrelloClient with
+the validator cache disabled and enabled. Calls stay below the per-token rate
+limit so only transfer and parse time is measured.
+
+    python benchmarks/bench_conditional_get.py [--cards 2000] [--calls 80]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+from mock_trello import CARD, MockTrelloHandler, start_server  # noqa: E402
+from server.utils.trello_api import TrelloClient  # noqa: E402
+
+
+async def measure(base_url: str, token: str, etag_cache_size: int, calls: int):
+    client = TrelloClient("bench-key", token, etag_cache_size=etag_cache_size)
+    client.client.base_url = base_url
+    timings = []
+    try:
+        for _ in range(calls):
+            start = time.perf_counter()
+            await client.GET("/lists/5f1a2b3c4d5e6f7a8b9c0d1f/cards")
+            timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        await client.close()
+    return timings, client.not_modified
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cards", type=int, default=2000)
+    parser.add_argument("--calls", type=int, default=80)
+    args = parser.parse_args()
+
+    cards = [dict(CARD, id="%024x" % i, name=f"Card {i}", desc="x" * 200) for i in range(args.cards)]
+    handler = type("CardListHandler", (MockTrelloHandler,), {"body": json.dumps(cards).encode()})
+    server, base_url = start_server(handler=handler)
+    print(f"{args.cards} cards, {len(handler.body) / 1024:.1f} KiB per full response, {args.calls} reads")
+    try:
+        for label, token, size in [("unconditional", "bench-a", 0), ("conditional (ETag)", "bench-b", 256)]:
+            timings, not_modified = asyncio.run(measure(base_url, token, size, args.calls))
+            print(f"  {label:<20} mean {statistics.mean(timings):7.2f} ms   p50 {statistics.median(timings):7.2f} ms   304s {not_modified}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
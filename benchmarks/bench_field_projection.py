@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Payload size and JSON parse time of `fields=all` vs. the sync's projected field sets.
+
+Builds a synthetic board whose cards look like Trello's `fields=all` output
+(descriptions, badges, cover, checklist state, ...) and compares it with the
+field sets weekly_milestone_sync.py requests per phase.
+
+    python benchmarks/bench_field_projection.py [--cards 5000]
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from weekly_milestone_sync import MAPPED_CARD_FIELDS, SCAN_CARD_FIELDS  # noqa: E402
+
+
+def fake_id(rng: random.Random) -> str:
+    return "%024x" % rng.getrandbits(96)
+
+
+def full_card(rng: random.Random, board_id: str, labels: list[dict]) -> dict:
+    card_id = fake_id(rng)
+    desc = " ".join(rng.choice(["lorem", "ipsum", "dolor", "sit", "amet", "sprint", "deploy"]) for _ in range(rng.randint(20, 200)))
+    return {
+        "id": card_id,
+        "badges": {
+            "attachmentsByType": {"trello": {"board": 0, "card": 0}},
+            "location": False, "votes": 0, "viewingMemberVoted": False, "subscribed": False,
+            "fogbugz": "", "checkItems": 4, "checkItemsChecked": 1, "checkItemsEarliestDue": None,
+            "comments": rng.randint(0, 12), "attachments": rng.randint(0, 3), "description": True,
+            "due": None, "dueComplete": False, "start": None,
+        },
+        "checkItemStates": [],
+        "closed": False,
+        "dueComplete": False,
+        "dateLastActivity": "2025-10-24T09:12:33.000Z",
+        "desc": desc,
+        "descData": {"emoji": {}},
+        "due": None,
+        "dueReminder": None,
+        "email": None,
+        "idBoard": board_id,
+        "idChecklists": [fake_id(rng) for _ in range(rng.randint(0, 3))],
+        "idList": fake_id(rng),
+        "idMembers": [fake_id(rng) for _ in range(rng.randint(0, 3))],
+        "idMembersVoted": [],
+        "idShort": rng.randint(1, 5000),
+        "idAttachmentCover": None,
+        "labels": rng.sample(labels, rng.randint(0, 2)),
+        "idLabels": [],
+        "manualCoverAttachment": False,
+        "name": f"Card {card_id[-6:]}",
+        "pos": rng.random() * 65536,
+        "shortLink": card_id[-8:],
+        "shortUrl": f"https://trello.com/c/{card_id[-8:]}",
+        "start": None,
+        "subscribed": False,
+        "url": f"https://trello.com/c/{card_id[-8:]}/{card_id[-4:]}-card",
+        "cover": {"idAttachment": None, "color": None, "idUploadedBackground": None, "size": "normal", "brightness": "dark", "idPlugin": None},
+        "isTemplate": False,
+        "cardRole": None,
+    }
+
+
+def project(card: dict, fields: str) -> dict:
+    return {field: card[field] for field in fields.split(",")}
+
+
+def parse_time(raw: bytes, rounds: int = 5) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        json.loads(raw)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cards", type=int, default=5000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    board_id = fake_id(rng)
+    labels = [{"id": fake_id(rng), "idBoard": board_id, "name": name, "color": color}
+              for name, color in [("This Week", "orange"), ("Bug", "red"), ("Feature", "green")]]
+    cards = [full_card(rng, board_id, labels) for _ in range(args.cards)]
+
+    payloads = {
+        "fields=all": cards,
+        "scan fields": [project(card, SCAN_CARD_FIELDS) for card in cards],
+        "mapped-card fields": [project(card, MAPPED_CARD_FIELDS) for card in cards],
+    }
+    baseline = None
+    print(f"{args.cards} cards on one board")
+    for label, payload in payloads.items():
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        parse_ms = parse_time(raw)
+        baseline = baseline or (len(raw), parse_ms)
+        print(f"  {label:<20} {len(raw) / 1024:9.1f} KiB ({len(raw) / baseline[0]:5.1%})   parse {parse_ms:7.2f} ms ({parse_ms / baseline[1]:5.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Per-call latency of a new connection per request vs. one pooled TrelloClient.
+
+Mirrors how the weekly sync used to open a fresh connection for every request
+and how it now sends everything through one TrelloClient and its keep-alive
+pool. Runs against a local mock Trello server, with and without TLS (the mock's
+certificate is self-signed, so verification is turned off). Calls stay below
+the per-token rate limit so only connection and transfer time is measured.
+
+    python benchmarks/bench_http_pool.py [--calls 80]
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import statistics
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+from mock_trello import start_server  # noqa: E402
+from server.utils.trello_api import TrelloClient  # noqa: E402
+
+# Every client gets its own key and token, so no measurement waits on another's rate budget
+_credentials = itertools.count()
+
+
+def make_client(base_url: str) -> TrelloClient:
+    n = next(_credentials)
+    client = TrelloClient(f"bench-key-{n}", f"bench-token-{n}", etag_cache_size=0)
+    client.client = httpx.AsyncClient(
+        base_url=base_url,
+        verify=False,
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+    )
+    return client
+
+
+async def per_call(base_url: str, endpoint: str, calls: int) -> list[float]:
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        client = make_client(base_url)
+        try:
+            await client.GET(endpoint, {"fields": "all"})
+        finally:
+            await client.close()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def pooled(base_url: str, endpoint: str, calls: int) -> list[float]:
+    client = make_client(base_url)
+    timings = []
+    try:
+        for _ in range(calls):
+            start = time.perf_counter()
+            await client.GET(endpoint, {"fields": "all"})
+            timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        await client.close()
+    return timings
+
+
+def report(label: str, timings: list[float]):
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"  {label:<26} mean {statistics.mean(timings):6.2f} ms   p50 {statistics.median(timings):6.2f} ms   p95 {p95:6.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=80)
+    args = parser.parse_args()
+
+    endpoint = "/cards/5f1a2b3c4d5e6f7a8b9c0d1e"
+    for tls in (False, True):
+        server, base_url = start_server(tls=tls)
+        print(f"{'HTTPS' if tls else 'HTTP'} mock server, {args.calls} sequential GETs")
+        try:
+            report("new connection per call", asyncio.run(per_call(base_url, endpoint, args.calls)))
+            report("pooled TrelloClient", asyncio.run(pooled(base_url, endpoint, args.calls)))
+        finally:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Cards/sec for the ways the services can turn a card list response into models.
+
+Builds a JSON fixture shaped like `GET /lists/{id}/cards` and compares
+per-dict `TrelloCard(**card)` construction, TypeAdapter validation of the raw
+bytes, and unvalidated `model_construct` (which pydantic 2 runs in Python, so
+it is slower than validating in pydantic-core).
+
+    python benchmarks/bench_models.py [--cards 10000]
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from server.models import TrelloCard, TrelloCardList, TrelloLabel  # noqa: E402
+
+
+def fake_id(rng: random.Random) -> str:
+    return "%024x" % rng.getrandbits(96)
+
+
+def fixture(cards: int) -> bytes:
+    rng = random.Random(42)
+    board_id, list_id = fake_id(rng), fake_id(rng)
+    labels = [{"id": fake_id(rng), "idBoard": board_id, "name": name, "color": color}
+              for name, color in [("This Week", "orange"), ("Bug", "red"), ("Feature", "green")]]
+    return json.dumps([
+        {
+            "id": fake_id(rng),
+            "name": f"Card {i}",
+            "desc": "lorem ipsum " * rng.randint(0, 20),
+            "closed": False,
+            "idList": list_id,
+            "idBoard": board_id,
+            "url": f"https://trello.com/c/{i:08d}/card",
+            "pos": rng.random() * 65536,
+            "labels": rng.sample(labels, rng.randint(0, 2)),
+            "due": None,
+            "idMembers": [],
+        }
+        for i in range(cards)
+    ]).encode()
+
+
+def construct_cards(cards: list[dict]) -> list[TrelloCard]:
+    return [
+        TrelloCard.model_construct(
+            **{**card, "labels": [TrelloLabel.model_construct(**label) for label in card["labels"]]}
+        )
+        for card in cards
+    ]
+
+
+def measure(convert, raw: bytes, rounds: int = 5) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        convert(raw)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cards", type=int, default=10000)
+    args = parser.parse_args()
+
+    raw = fixture(args.cards)
+    approaches = {
+        "json.loads + TrelloCard(**card)": lambda raw: [TrelloCard(**card) for card in json.loads(raw)],
+        "TypeAdapter.validate_json": TrelloCardList.validate_json,
+        "json.loads + model_construct": lambda raw: construct_cards(json.loads(raw)),
+    }
+    print(f"{args.cards} cards, {len(raw) / 1024:.1f} KiB")
+    baseline = None
+    for label, convert in approaches.items():
+        seconds = measure(convert, raw)
+        baseline = baseline or seconds
+        print(f"  {label:<34} {seconds * 1000:8.2f} ms   {args.cards / seconds:12,.0f} cards/s   x{baseline / seconds:.2f}")
+
+
+if __name__ == "__main__":
+    main()
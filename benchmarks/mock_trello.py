@@ -0,0 +1,92 @@
+"""
+Minimal local stand-in for the Trello REST API used by the benchmarks.
+
+Every GET returns a fixed JSON card and every other verb echoes `{}`. GETs
+carry an ETag and honour If-None-Match with `304 Not Modified`. The
+server speaks HTTP/1.1 keep-alive and can optionally wrap the socket in TLS
+with a throwaway self-signed certificate (needs the `openssl` CLI).
+"""
+
+import hashlib
+import json
+import os
+import ssl
+import subprocess
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CARD = {
+    "id": "5f1a2b3c4d5e6f7a8b9c0d1e",
+    "name": "Benchmark card",
+    "idList": "5f1a2b3c4d5e6f7a8b9c0d1f",
+    "idBoard": "5f1a2b3c4d5e6f7a8b9c0d20",
+    "labels": [{"id": "5f1a2b3c4d5e6f7a8b9c0d21", "name": "This Week", "color": "orange"}],
+    "closed": False,
+}
+
+
+class MockTrelloHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, delayed ACKs
+    # stall every keep-alive response by ~40ms
+    disable_nagle_algorithm = True
+    body = json.dumps(CARD).encode()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, body: bytes, etag: str | None = None):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        if etag and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._reply(self.body, f'W/"{hashlib.md5(self.body).hexdigest()}"')
+
+    def do_POST(self):
+        self._reply(b"{}")
+
+    do_PUT = do_POST
+    do_DELETE = do_POST
+
+
+def _self_signed_context() -> ssl.SSLContext:
+    workdir = tempfile.mkdtemp()
+    cert, key = os.path.join(workdir, "cert.pem"), os.path.join(workdir, "key.pem")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", key, "-out", cert, "-days", "1", "-subj", "/CN=127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    return context
+
+
+def start_server(tls: bool = False, handler=MockTrelloHandler):
+    """Starts the mock server on a free port and returns (server, base_url)."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    scheme = "http"
+    if tls:
+        server.socket = _self_signed_context().wrap_socket(server.socket, server_side=True)
+        scheme = "https"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"{scheme}://127.0.0.1:{server.server_address[1]}/1"
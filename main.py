@@ -1,13 +1,18 @@
 import logging
 import os
+from contextlib import asynccontextmanager
 
 import uvicorn
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 from starlette.applications import Starlette
-from starlette.routing import Mount
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Mount, Route
 
 from server.tools.tools import register_tools
+from server.trello import cache
+from server.utils.metrics import default_registry
 
 # Configure logging
 logging.basicConfig(
@@ -43,6 +48,40 @@ def start_claude_server():
         raise
 
 
+def create_weekly_sync_webhook():
+    """Create the weekly sync webhook receiver if it is configured"""
+    secret = os.getenv("TRELLO_WEBHOOK_SECRET")
+    callback_url = os.getenv("TRELLO_WEBHOOK_CALLBACK_URL")
+    if not secret or not callback_url:
+        return None
+
+    # Imported lazily so the MCP server doesn't need the sync's configuration unless webhooks are on
+    from server.webhook import WeeklySyncWebhook
+    from weekly_milestone_sync import TrelloWeeklySync
+
+    return WeeklySyncWebhook(
+        TrelloWeeklySync(),
+        secret=secret,
+        callback_url=callback_url,
+        workers=int(os.getenv("WEBHOOK_WORKERS", "2")),
+        queue_size=int(os.getenv("WEBHOOK_QUEUE_SIZE", "1000")),
+        save_delay=float(os.getenv("WEBHOOK_SAVE_DELAY", "2")),
+    )
+
+
+async def metrics_endpoint(request: Request) -> PlainTextResponse:
+    """Trello API and read cache metrics in the Prometheus text format"""
+    cache_stats = cache.stats()
+    gauges = {
+        f"trello_cache_{name}": cache_stats[name]
+        for name in ("hits", "misses", "coalesced", "size")
+    }
+    return PlainTextResponse(
+        default_registry.render_prometheus(gauges),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
 def start_sse_server():
     """Start the MCP server in SSE mode using uvicorn"""
     try:
@@ -55,11 +94,28 @@ def start_sse_server():
         host = os.getenv("MCP_SERVER_HOST", "0.0.0.0")
         port = int(os.getenv("MCP_SERVER_PORT", "8000"))
 
+        routes = [Route("/metrics", metrics_endpoint, methods=["GET"])]
+        webhook = create_weekly_sync_webhook()
+        if webhook:
+            routes.append(
+                Route("/webhooks/trello", webhook.handle, methods=["HEAD", "POST"])
+            )
+            logger.info("Weekly sync webhook enabled at /webhooks/trello")
+
+        @asynccontextmanager
+        async def lifespan(app):
+            if webhook:
+                await webhook.start()
+            yield
+            if webhook:
+                await webhook.stop()
+
         # Create Starlette app with MCP server mounted
         app = Starlette(
-            routes=[
+            routes=routes + [
                 Mount("/", app=mcp.sse_app()),
-            ]
+            ],
+            lifespan=lifespan,
         )
 
         logger.info(
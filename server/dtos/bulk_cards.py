@@ -0,0 +1,35 @@
+from typing import List
+
+from pydantic import BaseModel
+
+from server.dtos.update_card import UpdateCardPayload
+
+
+class BulkUpdateCardItem(BaseModel):
+    """
+    One card update within a bulk update.
+
+    Attributes:
+        card_id (str): The ID of the card to update.
+        payload (UpdateCardPayload): The attributes to update on the card.
+    """
+
+    card_id: str
+    payload: UpdateCardPayload
+
+
+class BulkMoveCardsPayload(BaseModel):
+    """
+    Payload for moving several cards to one list.
+
+    Attributes:
+        card_ids (List[str]): The IDs of the cards to move.
+        idList (str): The ID of the list to move the cards to.
+        idBoard (str): The ID of the board the list is on, when moving across boards.
+        pos (str): The position of the cards in the target list.
+    """
+
+    card_ids: List[str]
+    idList: str
+    idBoard: str | None = None
+    pos: str | None = None
@@ -1,6 +1,6 @@
 from typing import List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 
 class TrelloBoard(BaseModel):
@@ -45,3 +45,88 @@ class TrelloCard(BaseModel):
     pos: float
     labels: List[TrelloLabel] = []
     due: str | None = None
+
+
+class BulkCardResult(BaseModel):
+    """Outcome of one item of a bulk card operation."""
+
+    index: int
+    card_id: str | None = None
+    success: bool
+    card: TrelloCard | None = None
+    error: str | None = None
+
+
+class TrelloMember(BaseModel):
+    """Model representing a Trello member."""
+
+    id: str
+    fullName: str | None = None
+    username: str | None = None
+
+
+class SnapshotCheckItem(BaseModel):
+    """Checklist item within a board snapshot."""
+
+    id: str
+    name: str
+    state: str
+
+
+class SnapshotChecklist(BaseModel):
+    """Checklist within a board snapshot."""
+
+    id: str
+    name: str
+    checkItems: List[SnapshotCheckItem] = []
+
+
+class SnapshotCard(BaseModel):
+    """Card within a board snapshot, with label and member IDs resolved on the board."""
+
+    id: str
+    name: str
+    desc: str | None = None
+    closed: bool = False
+    idList: str
+    pos: float
+    due: str | None = None
+    url: str | None = None
+    idLabels: List[str] = []
+    idMembers: List[str] = []
+    checklists: List[SnapshotChecklist] = []
+
+
+class SnapshotList(BaseModel):
+    """List within a board snapshot, with its cards."""
+
+    id: str
+    name: str
+    closed: bool = False
+    pos: float
+    cards: List[SnapshotCard] = []
+
+
+class BoardSnapshot(BaseModel):
+    """A board with its lists, cards, checklists, labels and members."""
+
+    id: str
+    name: str
+    desc: str | None = None
+    url: str
+    labels: List[TrelloLabel] = []
+    members: List[TrelloMember] = []
+    lists: List[SnapshotList] = []
+
+
+class CardPage(BaseModel):
+    """One page of cards, newest first, with the token for the next page."""
+
+    cards: List[TrelloCard] = []
+    next_page_token: str | None = None
+
+
+# Validate a whole JSON array in one pass, straight from the response bytes
+TrelloCardList = TypeAdapter(List[TrelloCard])
+TrelloListList = TypeAdapter(List[TrelloList])
+
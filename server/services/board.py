@@ -4,17 +4,46 @@ Service for managing Trello boards in MCP server.
 
 from typing import List
 
-from server.models import TrelloBoard, TrelloLabel
+from server.models import (
+    BoardSnapshot,
+    SnapshotCard,
+    SnapshotChecklist,
+    SnapshotList,
+    TrelloBoard,
+    TrelloLabel,
+    TrelloMember,
+)
+from server.utils.cache import AsyncTTLCache
 from server.utils.trello_api import TrelloClient
 
 
+# Nested resources fetched alongside the board by get_board_snapshot
+SNAPSHOT_PARAMS = {
+    "fields": "name,desc,url",
+    "lists": "open",
+    "list_fields": "name,closed,pos",
+    "cards": "open",
+    "card_fields": "name,desc,closed,idList,pos,due,shortUrl,idLabels,idMembers",
+    "checklists": "all",
+    "checklist_fields": "name,idCard,pos",
+    "labels": "all",
+    "label_fields": "name,color",
+    "members": "all",
+    "member_fields": "fullName,username",
+}
+
+
 class BoardService:
     """
     Service class for managing Trello boards
     """
 
-    def __init__(self, client: TrelloClient):
+    def __init__(self, client: TrelloClient, cache: AsyncTTLCache | None = None):
         self.client = client
+        self.cache = cache or AsyncTTLCache(maxsize=0)
+
+    async def _cached_get(self, endpoint: str):
+        return await self.cache.get_or_fetch(endpoint, lambda: self.client.GET(endpoint))
 
     async def get_board(self, board_id: str) -> TrelloBoard:
         """Retrieves a specific board by its ID.
@@ -25,7 +54,7 @@ class BoardService:
         Returns:
             TrelloBoard: The board object containing board details.
         """
-        response = await self.client.GET(f"/boards/{board_id}")
+        response = await self._cached_get(f"/boards/{board_id}")
         return TrelloBoard(**response)
 
     async def get_boards(self, member_id: str = "me") -> List[TrelloBoard]:
@@ -37,7 +66,7 @@ class BoardService:
         Returns:
             List[TrelloBoard]: A list of board objects.
         """
-        response = await self.client.GET(f"/members/{member_id}/boards")
+        response = await self._cached_get(f"/members/{member_id}/boards")
         return [TrelloBoard(**board) for board in response]
 
     async def get_board_labels(self, board_id: str) -> List[TrelloLabel]:
@@ -49,7 +78,7 @@ class BoardService:
         Returns:
             List[TrelloLabel]: A list of label objects for the board.
         """
-        response = await self.client.GET(f"/boards/{board_id}/labels")
+        response = await self._cached_get(f"/boards/{board_id}/labels")
         return [TrelloLabel(**label) for label in response]
 
     async def create_board_label(self, board_id: str, **kwargs) -> TrelloLabel:
@@ -62,4 +91,74 @@ class BoardService:
             List[TrelloLabel]: A list of label objects for the board.
         """
         response = await self.client.POST(f"/boards/{board_id}/labels", data=kwargs)
+        self.cache.invalidate(f"/boards/{board_id}/labels")
         return TrelloLabel(**response)
+
+    async def get_board_snapshot(
+        self,
+        board_id: str,
+        list_ids: List[str] | None = None,
+        label: str | None = None,
+    ) -> BoardSnapshot:
+        """Retrieves a board with its open lists, cards, checklists, labels and members in one request.
+
+        Not cached here: checklist and member changes are not seen by the cache's
+        invalidation, and repeat reads are revalidated by the client's ETags.
+
+        Args:
+            board_id (str): The ID of the board to retrieve.
+            list_ids (List[str], optional): Only include these lists.
+            label (str, optional): Only include cards carrying this label, by ID or name.
+
+        Returns:
+            BoardSnapshot: The board with its lists and cards nested.
+        """
+        response = await self.client.GET(f"/boards/{board_id}", params=SNAPSHOT_PARAMS)
+
+        labels = [TrelloLabel(**label_data) for label_data in response.get("labels", [])]
+        label_ids = None
+        if label:
+            label_ids = {
+                board_label.id
+                for board_label in labels
+                if label in (board_label.id, board_label.name)
+            }
+
+        checklists_by_card: dict[str, List[SnapshotChecklist]] = {}
+        for checklist in sorted(
+            response.get("checklists", []), key=lambda checklist: checklist.get("pos", 0)
+        ):
+            checklists_by_card.setdefault(checklist["idCard"], []).append(
+                SnapshotChecklist(**checklist)
+            )
+
+        lists = {
+            list_data["id"]: SnapshotList(**list_data)
+            for list_data in response.get("lists", [])
+            if list_ids is None or list_data["id"] in list_ids
+        }
+        for card in response.get("cards", []):
+            snapshot_list = lists.get(card["idList"])
+            if snapshot_list is None:
+                continue
+            if label_ids is not None and label_ids.isdisjoint(card.get("idLabels", [])):
+                continue
+            snapshot_list.cards.append(
+                SnapshotCard(
+                    **card,
+                    url=card.get("shortUrl"),
+                    checklists=checklists_by_card.get(card["id"], []),
+                )
+            )
+        for snapshot_list in lists.values():
+            snapshot_list.cards.sort(key=lambda card: card.pos)
+
+        return BoardSnapshot(
+            id=response["id"],
+            name=response["name"],
+            desc=response.get("desc"),
+            url=response["url"],
+            labels=labels,
+            members=[TrelloMember(**member) for member in response.get("members", [])],
+            lists=sorted(lists.values(), key=lambda snapshot_list: snapshot_list.pos),
+        )
@@ -2,19 +2,44 @@
 Service for managing Trello cards in MCP server.
 """
 
-from typing import Any, Dict, List
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List
 
-from server.models import TrelloCard
+from server.models import (
+    BulkCardResult,
+    CardPage,
+    TrelloCard,
+    TrelloCardList,
+)
+from server.utils.cache import AsyncTTLCache
 from server.utils.trello_api import TrelloClient
 
+# Tag shared by every cached list of cards; a card update may move it between lists
+LIST_CARDS_TAG = "list-cards"
+
+# Cards per page for paginated listing; Trello caps `limit` at 1000
+CARD_PAGE_SIZE = 100
+MAX_CARD_PAGE_SIZE = 1000
+
+# Cards written at once by the bulk operations; the rate limiter still paces them
+BULK_CONCURRENCY = 5
+
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
 
 class CardService:
     """
     Service class for managing Trello cards.
     """
 
-    def __init__(self, client: TrelloClient):
+    def __init__(self, client: TrelloClient, cache: AsyncTTLCache | None = None):
         self.client = client
+        self.cache = cache or AsyncTTLCache(maxsize=0)
+
+    async def _cached_get(self, endpoint: str, tags=(), raw: bool = False):
+        return await self.cache.get_or_fetch(
+            endpoint, lambda: self.client.GET(endpoint, raw=raw), tags=tags
+        )
 
     async def get_card(self, card_id: str) -> TrelloCard:
         """Retrieves a specific card by its ID.
@@ -25,7 +50,7 @@ class CardService:
         Returns:
             TrelloCard: The card object containing card details.
         """
-        response = await self.client.GET(f"/cards/{card_id}")
+        response = await self._cached_get(f"/cards/{card_id}")
         return TrelloCard(**response)
 
     async def get_cards(self, list_id: str) -> List[TrelloCard]:
@@ -37,8 +62,77 @@ class CardService:
         Returns:
             List[TrelloCard]: A list of card objects.
         """
-        response = await self.client.GET(f"/lists/{list_id}/cards")
-        return [TrelloCard(**card) for card in response]
+        response = await self._cached_get(
+            f"/lists/{list_id}/cards", tags=(LIST_CARDS_TAG,), raw=True
+        )
+        return TrelloCardList.validate_json(response)
+
+    async def get_cards_page(
+        self,
+        list_id: str,
+        limit: int = CARD_PAGE_SIZE,
+        before: str | None = None,
+        since: str | None = None,
+    ) -> CardPage:
+        """Retrieves one page of the cards in a list, newest first.
+
+        Trello card IDs start with their creation time, so a card ID works as a
+        cursor: the next page holds the cards created before the oldest one here.
+
+        Args:
+            list_id (str): The ID of the list whose cards to retrieve.
+            limit (int): The maximum number of cards in the page, at most 1000.
+            before (str, optional): Only cards created before this card ID (the page token).
+            since (str, optional): Only cards created after this card ID.
+
+        Returns:
+            CardPage: The cards and the token for the next page, if there may be one.
+        """
+        limit = max(1, min(limit, MAX_CARD_PAGE_SIZE))
+        params = {"limit": limit}
+        if before:
+            params["before"] = before
+        if since:
+            params["since"] = since
+        response = await self.client.GET(
+            f"/lists/{list_id}/cards", params=params, raw=True
+        )
+        cards = sorted(
+            TrelloCardList.validate_json(response), key=lambda card: card.id, reverse=True
+        )
+        return CardPage(
+            cards=cards,
+            next_page_token=cards[-1].id if len(cards) == limit else None,
+        )
+
+    async def iter_cards(
+        self,
+        list_id: str,
+        page_size: int = CARD_PAGE_SIZE,
+        since: str | None = None,
+    ) -> AsyncIterator[List[TrelloCard]]:
+        """Yields the cards in a list page by page, newest first.
+
+        Only one page of cards is held in memory at a time.
+
+        Args:
+            list_id (str): The ID of the list whose cards to retrieve.
+            page_size (int): The number of cards requested per page.
+            since (str, optional): Stop at cards created before this card ID.
+
+        Yields:
+            List[TrelloCard]: The cards of each page.
+        """
+        before = None
+        while True:
+            page = await self.get_cards_page(
+                list_id, limit=page_size, before=before, since=since
+            )
+            if page.cards:
+                yield page.cards
+            if not page.next_page_token:
+                return
+            before = page.next_page_token
 
     async def create_card(self, **kwargs) -> TrelloCard:
         """Creates a new card in a given list.
@@ -52,6 +146,7 @@ class CardService:
             TrelloCard: The newly created card object.
         """
         response = await self.client.POST("/cards", data=kwargs)
+        self.cache.invalidate(f"/lists/{response['idList']}/cards")
         return TrelloCard(**response)
 
     async def update_card(self, card_id: str, **kwargs) -> TrelloCard:
@@ -65,6 +160,7 @@ class CardService:
             TrelloCard: The updated card object.
         """
         response = await self.client.PUT(f"/cards/{card_id}", data=kwargs)
+        self.cache.invalidate(f"/cards/{card_id}", LIST_CARDS_TAG)
         return TrelloCard(**response)
 
     async def delete_card(self, card_id: str) -> Dict[str, Any]:
@@ -76,4 +172,88 @@ class CardService:
         Returns:
             Dict[str, Any]: The response from the delete operation.
         """
-        return await self.client.DELETE(f"/cards/{card_id}")
+        response = await self.client.DELETE(f"/cards/{card_id}")
+        self.cache.invalidate(f"/cards/{card_id}", LIST_CARDS_TAG)
+        return response
+
+    async def _run_bulk(
+        self,
+        operations: List[tuple[str | None, Callable[[], Awaitable[TrelloCard]]]],
+        concurrency: int,
+        on_progress: ProgressCallback | None,
+    ) -> List[BulkCardResult]:
+        """Runs card operations concurrently, collecting a result per item."""
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        total = len(operations)
+        done = 0
+
+        async def run(index: int, card_id: str | None, operation) -> BulkCardResult:
+            nonlocal done
+            async with semaphore:
+                try:
+                    card = await operation()
+                    result = BulkCardResult(
+                        index=index, card_id=card.id, success=True, card=card
+                    )
+                except Exception as e:
+                    result = BulkCardResult(
+                        index=index, card_id=card_id, success=False, error=str(e)
+                    )
+            done += 1
+            if on_progress:
+                await on_progress(done, total)
+            return result
+
+        return await asyncio.gather(
+            *(
+                run(index, card_id, operation)
+                for index, (card_id, operation) in enumerate(operations)
+            )
+        )
+
+    async def bulk_create_cards(
+        self,
+        payloads: List[Dict[str, Any]],
+        concurrency: int = BULK_CONCURRENCY,
+        on_progress: ProgressCallback | None = None,
+    ) -> List[BulkCardResult]:
+        """Creates several cards concurrently.
+
+        Args:
+            payloads (List[Dict[str, Any]]): The attributes of each card to create.
+            concurrency (int): How many cards are created at the same time.
+            on_progress (ProgressCallback, optional): Awaited with (done, total) as items finish.
+
+        Returns:
+            List[BulkCardResult]: One result per payload, in input order.
+        """
+        return await self._run_bulk(
+            [(None, lambda data=data: self.create_card(**data)) for data in payloads],
+            concurrency,
+            on_progress,
+        )
+
+    async def bulk_update_cards(
+        self,
+        updates: List[tuple[str, Dict[str, Any]]],
+        concurrency: int = BULK_CONCURRENCY,
+        on_progress: ProgressCallback | None = None,
+    ) -> List[BulkCardResult]:
+        """Updates several cards concurrently.
+
+        Args:
+            updates (List[tuple[str, Dict[str, Any]]]): (card ID, attributes to update) pairs.
+            concurrency (int): How many cards are updated at the same time.
+            on_progress (ProgressCallback, optional): Awaited with (done, total) as items finish.
+
+        Returns:
+            List[BulkCardResult]: One result per update, in input order.
+        """
+        return await self._run_bulk(
+            [
+                (card_id, lambda card_id=card_id, data=data: self.update_card(card_id, **data))
+                for card_id, data in updates
+            ],
+            concurrency,
+            on_progress,
+        )
@@ -1,6 +1,7 @@
 from typing import List
 
-from server.models import TrelloList
+from server.models import TrelloList, TrelloListList
+from server.utils.cache import AsyncTTLCache
 from server.utils.trello_api import TrelloClient
 
 
@@ -9,8 +10,17 @@ class ListService:
     Service class for managing Trello lists.
     """
 
-    def __init__(self, client: TrelloClient):
+    def __init__(self, client: TrelloClient, cache: AsyncTTLCache | None = None):
         self.client = client
+        self.cache = cache or AsyncTTLCache(maxsize=0)
+
+    async def _cached_get(self, endpoint: str, raw: bool = False):
+        return await self.cache.get_or_fetch(
+            endpoint, lambda: self.client.GET(endpoint, raw=raw)
+        )
+
+    def _invalidate(self, list_id: str, board_id: str):
+        self.cache.invalidate(f"/lists/{list_id}", f"/boards/{board_id}/lists")
 
     # Lists
     async def get_list(self, list_id: str) -> TrelloList:
@@ -22,7 +32,7 @@ class ListService:
         Returns:
             TrelloList: The list object containing list details.
         """
-        response = await self.client.GET(f"/lists/{list_id}")
+        response = await self._cached_get(f"/lists/{list_id}")
         return TrelloList(**response)
 
     async def get_lists(self, board_id: str) -> List[TrelloList]:
@@ -34,8 +44,8 @@ class ListService:
         Returns:
             List[TrelloList]: A list of list objects.
         """
-        response = await self.client.GET(f"/boards/{board_id}/lists")
-        return [TrelloList(**list_data) for list_data in response]
+        response = await self._cached_get(f"/boards/{board_id}/lists", raw=True)
+        return TrelloListList.validate_json(response)
 
     async def create_list(
         self, board_id: str, name: str, pos: str = "bottom"
@@ -52,6 +62,7 @@ class ListService:
         """
         data = {"name": name, "idBoard": board_id, "pos": pos}
         response = await self.client.POST("/lists", data=data)
+        self.cache.invalidate(f"/boards/{board_id}/lists")
         return TrelloList(**response)
 
     async def update_list(self, list_id: str, name: str) -> TrelloList:
@@ -65,6 +76,7 @@ class ListService:
             TrelloList: The updated list object.
         """
         response = await self.client.PUT(f"/lists/{list_id}", data={"name": name})
+        self._invalidate(list_id, response["idBoard"])
         return TrelloList(**response)
 
     async def delete_list(self, list_id: str) -> TrelloList:
@@ -79,4 +91,5 @@ class ListService:
         response = await self.client.PUT(
             f"/lists/{list_id}/closed", data={"value": "true"}
         )
+        self._invalidate(list_id, response["idBoard"])
         return TrelloList(**response)
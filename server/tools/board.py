@@ -7,14 +7,14 @@ from typing import List
 
 from mcp.server.fastmcp import Context
 
-from server.models import TrelloBoard, TrelloLabel
+from server.models import BoardSnapshot, TrelloBoard, TrelloLabel
 from server.dtos.create_label import CreateLabelPayload
 from server.services.board import BoardService
-from server.trello import client
+from server.trello import cache, client
 
 logger = logging.getLogger(__name__)
 
-service = BoardService(client)
+service = BoardService(client, cache)
 
 
 async def get_board(ctx: Context, board_id: str) -> TrelloBoard:
@@ -99,3 +99,35 @@ async def create_board_label(ctx: Context, board_id: str, payload: CreateLabelPa
         await ctx.error(error_msg)
         raise
 
+
+
+async def get_board_snapshot(
+    ctx: Context,
+    board_id: str,
+    list_ids: List[str] | None = None,
+    label: str | None = None,
+) -> BoardSnapshot:
+    """Retrieves a whole board in one request: its open lists, their cards with checklists, labels and members.
+
+    Args:
+        board_id (str): The ID of the board to retrieve.
+        list_ids (List[str], optional): Only include these lists.
+        label (str, optional): Only include cards carrying this label, by ID or name.
+
+    Returns:
+        BoardSnapshot: The board with its lists and cards nested.
+    """
+    try:
+        logger.info(f"Getting snapshot of board: {board_id}")
+        result = await service.get_board_snapshot(board_id, list_ids=list_ids, label=label)
+        card_count = sum(len(snapshot_list.cards) for snapshot_list in result.lists)
+        logger.info(
+            f"Successfully retrieved snapshot of board {board_id}: "
+            f"{len(result.lists)} lists, {card_count} cards"
+        )
+        return result
+    except Exception as e:
+        error_msg = f"Failed to get board snapshot: {str(e)}"
+        logger.error(error_msg)
+        await ctx.error(error_msg)
+        raise
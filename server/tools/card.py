@@ -7,15 +7,16 @@ from typing import List
 
 from mcp.server.fastmcp import Context
 
-from server.models import TrelloCard
+from server.models import BulkCardResult, CardPage, TrelloCard
 from server.services.card import CardService
-from server.trello import client
+from server.trello import cache, client
 from server.dtos.update_card import UpdateCardPayload
 from server.dtos.create_card import CreateCardPayload
+from server.dtos.bulk_cards import BulkMoveCardsPayload, BulkUpdateCardItem
 
 logger = logging.getLogger(__name__)
 
-service = CardService(client)
+service = CardService(client, cache)
 
 
 async def get_card(ctx: Context, card_id: str) -> TrelloCard:
@@ -60,6 +61,31 @@ async def get_cards(ctx: Context, list_id: str) -> List[TrelloCard]:
         raise
 
 
+async def get_cards_page(
+    ctx: Context, list_id: str, page_token: str | None = None, limit: int = 100
+) -> CardPage:
+    """Retrieves the cards in a list one page at a time, newest first. Use this instead of get_cards for very large lists.
+
+    Args:
+        list_id (str): The ID of the list whose cards to retrieve.
+        page_token (str, optional): The next_page_token of the previous page; omit for the first page.
+        limit (int): The maximum number of cards per page, at most 1000. Defaults to 100.
+
+    Returns:
+        CardPage: The cards and the token for the next page, which is null on the last page.
+    """
+    try:
+        logger.info(f"Getting page of cards for list: {list_id} (token: {page_token})")
+        result = await service.get_cards_page(list_id, limit=limit, before=page_token)
+        logger.info(f"Successfully retrieved {len(result.cards)} cards for list: {list_id}")
+        return result
+    except Exception as e:
+        error_msg = f"Failed to get cards page: {str(e)}"
+        logger.error(error_msg)
+        await ctx.error(error_msg)
+        raise
+
+
 async def create_card(ctx: Context, payload: CreateCardPayload) -> TrelloCard:
     """Creates a new card in a given list.
 
@@ -128,3 +154,92 @@ async def delete_card(ctx: Context, card_id: str) -> dict:
         logger.error(error_msg)
         await ctx.error(error_msg)
         raise
+
+
+def _log_bulk_results(operation: str, results: List[BulkCardResult]):
+    failed = [result for result in results if not result.success]
+    logger.info(f"Bulk {operation}: {len(results) - len(failed)} succeeded, {len(failed)} failed")
+    for result in failed:
+        logger.error(f"Bulk {operation} item {result.index} failed: {result.error}")
+
+
+async def bulk_create_cards(
+    ctx: Context, payloads: List[CreateCardPayload]
+) -> List[BulkCardResult]:
+    """Creates several cards at once.
+
+    Args:
+        payloads (List[CreateCardPayload]): The cards to create.
+
+    Returns:
+        List[BulkCardResult]: The outcome of each item, in input order.
+    """
+    try:
+        logger.info(f"Bulk creating {len(payloads)} cards")
+        results = await service.bulk_create_cards(
+            [payload.model_dump(exclude_unset=True) for payload in payloads],
+            on_progress=ctx.report_progress,
+        )
+        _log_bulk_results("create", results)
+        return results
+    except Exception as e:
+        error_msg = f"Failed to bulk create cards: {str(e)}"
+        logger.error(error_msg)
+        await ctx.error(error_msg)
+        raise
+
+
+async def bulk_update_cards(
+    ctx: Context, items: List[BulkUpdateCardItem]
+) -> List[BulkCardResult]:
+    """Updates several cards at once.
+
+    Args:
+        items (List[BulkUpdateCardItem]): The card IDs and the attributes to update on each.
+
+    Returns:
+        List[BulkCardResult]: The outcome of each item, in input order.
+    """
+    try:
+        logger.info(f"Bulk updating {len(items)} cards")
+        results = await service.bulk_update_cards(
+            [
+                (item.card_id, item.payload.model_dump(exclude_unset=True))
+                for item in items
+            ],
+            on_progress=ctx.report_progress,
+        )
+        _log_bulk_results("update", results)
+        return results
+    except Exception as e:
+        error_msg = f"Failed to bulk update cards: {str(e)}"
+        logger.error(error_msg)
+        await ctx.error(error_msg)
+        raise
+
+
+async def bulk_move_cards(
+    ctx: Context, payload: BulkMoveCardsPayload
+) -> List[BulkCardResult]:
+    """Moves several cards to one list.
+
+    Args:
+        payload (BulkMoveCardsPayload): The cards to move and the target list.
+
+    Returns:
+        List[BulkCardResult]: The outcome of each card, in input order.
+    """
+    try:
+        logger.info(f"Moving {len(payload.card_ids)} cards to list {payload.idList}")
+        target = payload.model_dump(exclude_unset=True, exclude={"card_ids"})
+        results = await service.bulk_update_cards(
+            [(card_id, target) for card_id in payload.card_ids],
+            on_progress=ctx.report_progress,
+        )
+        _log_bulk_results("move", results)
+        return results
+    except Exception as e:
+        error_msg = f"Failed to bulk move cards: {str(e)}"
+        logger.error(error_msg)
+        await ctx.error(error_msg)
+        raise
@@ -9,11 +9,11 @@ from mcp.server.fastmcp import Context
 
 from server.models import TrelloList
 from server.services.list import ListService
-from server.trello import client
+from server.trello import cache, client
 
 logger = logging.getLogger(__name__)
 
-service = ListService(client)
+service = ListService(client, cache)
 
 
 # List Tools
@@ -9,6 +9,7 @@ def register_tools(mcp):
     """Register tools with the MCP server."""
     # Board Tools
     mcp.add_tool(board.get_board)
+    mcp.add_tool(board.get_board_snapshot)
     mcp.add_tool(board.get_boards)
     mcp.add_tool(board.get_board_labels)
     mcp.add_tool(board.create_board_label)
@@ -23,9 +24,13 @@ def register_tools(mcp):
     # Card Tools
     mcp.add_tool(card.get_card)
     mcp.add_tool(card.get_cards)
+    mcp.add_tool(card.get_cards_page)
     mcp.add_tool(card.create_card)
     mcp.add_tool(card.update_card)
     mcp.add_tool(card.delete_card)
+    mcp.add_tool(card.bulk_create_cards)
+    mcp.add_tool(card.bulk_update_cards)
+    mcp.add_tool(card.bulk_move_cards)
 
     # Checklist Tools
     mcp.add_tool(checklist.get_checklist)
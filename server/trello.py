@@ -3,6 +3,8 @@ import os
 
 from dotenv import load_dotenv
 
+from server.utils.cache import AsyncTTLCache
+from server.utils.retry import RetryPolicy
 from server.utils.trello_api import TrelloClient
 
 # Configure logging
@@ -23,7 +25,24 @@ try:
         raise ValueError(
             "TRELLO_API_KEY and TRELLO_TOKEN must be set in environment variables"
         )
-    client = TrelloClient(api_key=api_key, token=token)
+    retry_policy = RetryPolicy(
+        max_retries=int(os.getenv("TRELLO_MAX_RETRIES", "3")),
+        retry_post=os.getenv("TRELLO_RETRY_POST", "false").lower() == "true",
+    )
+    client = TrelloClient(
+        api_key=api_key,
+        token=token,
+        retry_policy=retry_policy,
+        http2=os.getenv("TRELLO_HTTP2", "false").lower() == "true",
+        max_connections=int(os.getenv("TRELLO_MAX_CONNECTIONS", "20")),
+        etag_cache_size=int(os.getenv("TRELLO_ETAG_CACHE_SIZE", "256")),
+        timeout=float(os.getenv("TRELLO_TIMEOUT", "5")) or None,
+    )
+    # Shared by the board, list and card services so writes invalidate across them
+    cache = AsyncTTLCache(
+        maxsize=int(os.getenv("TRELLO_CACHE_SIZE", "512")),
+        ttl=float(os.getenv("TRELLO_CACHE_TTL", "30")),
+    )
     logger.info("Trello client and service initialized successfully")
 except Exception as e:
     logger.error(f"Failed to initialize Trello client: {str(e)}")
@@ -37,6 +56,7 @@ def trello_help() -> str:
     Available Trello Operations:
     1. Board Operations:
        - Get a specific board
+       - Get a whole board (lists, cards, checklists) in one call
        - List all boards
        - Get board labels
        - Add label to a board
@@ -52,6 +72,7 @@ def trello_help() -> str:
        - Create a new card
        - Update a card's attributes
        - Delete a card
+       - Create, update or move many cards at once
     4. Checklist Operations:
        - Get a specific checklist
        - List all checklists in a card
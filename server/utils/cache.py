@@ -0,0 +1,118 @@
+# cache.py
+"""
+Read-through cache for Trello lookups made by the MCP services.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Iterable
+
+
+class AsyncTTLCache:
+    """
+    Size-bounded TTL/LRU cache with in-flight request coalescing.
+
+    Concurrent lookups of the same key share one fetch, which keeps running
+    for the others when one of them is cancelled. Entries carry tags so a
+    write can drop everything derived from the object it changed. With
+    `maxsize=0` nothing is stored but concurrent lookups are still coalesced.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any, frozenset]] = OrderedDict()
+        self._inflight: dict[str, tuple[asyncio.Future, frozenset]] = {}
+        self._stale_inflight: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    async def get_or_fetch(
+        self, key: str, fetch: Callable[[], Awaitable[Any]], tags: Iterable[str] = ()
+    ) -> Any:
+        """Returns the cached value for `key`, calling `fetch` on a miss.
+
+        Args:
+            key (str): The cache key, usually the API endpoint.
+            fetch (Callable[[], Awaitable[Any]]): Loads the value on a miss.
+            tags (Iterable[str]): Extra names `invalidate` can drop this entry by.
+
+        Returns:
+            Any: The cached or freshly fetched value.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value, _ = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight[0])
+
+        self.misses += 1
+        tags = frozenset(tags)
+        # The fetch runs in its own task and every caller, the first one included, waits on
+        # it shielded, so a cancelled caller doesn't cancel the fetch for the others
+        task = asyncio.ensure_future(fetch())
+        self._inflight[key] = (task, tags)
+        task.add_done_callback(lambda task: self._finish(key, task, tags))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Future, tags: frozenset):
+        """Stores the result of a finished fetch, unless it failed or the key was invalidated."""
+        del self._inflight[key]
+        stale = key in self._stale_inflight
+        self._stale_inflight.discard(key)
+        # exception() also marks a failure as retrieved when nobody was waiting for it
+        if task.cancelled() or task.exception() is not None:
+            return
+        # A write that invalidated this key while it was being fetched wins
+        if not stale:
+            self._store(key, task.result(), tags)
+
+    def _store(self, key: str, value: Any, tags: frozenset):
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value, tags)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *keys_or_tags: str):
+        """Drops every entry whose key or one of whose tags is given."""
+        names = set(keys_or_tags)
+        for key in [
+            key
+            for key, (_, _, tags) in self._entries.items()
+            if key in names or tags & names
+        ]:
+            del self._entries[key]
+        self._stale_inflight.update(
+            key
+            for key, (_, tags) in self._inflight.items()
+            if key in names or tags & names
+        )
+
+    def clear(self):
+        self._entries.clear()
+        self._stale_inflight.update(self._inflight.keys())
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size."""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_ratio": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+        }
@@ -0,0 +1,183 @@
+# metrics.py
+"""
+Per-endpoint instrumentation of Trello API calls.
+
+Requests are grouped by method and endpoint template (`GET /cards/{id}`). Every
+client records into the process-wide registry unless given its own, so the
+MCP server's `/metrics` route also covers the weekly sync webhook's calls.
+"""
+
+import copy
+import threading
+from collections import Counter
+from typing import Dict
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class EndpointStats:
+    """Counters and latency histogram for one endpoint template."""
+
+    def __init__(self):
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.statuses = Counter()
+        self.bytes_received = 0
+        self.retries = 0
+        self.rate_limit_waits = 0
+        self.rate_limit_wait_seconds = 0.0
+
+    def observe(self, seconds: float, status: int | str, size: int):
+        index = next(
+            (i for i, bound in enumerate(LATENCY_BUCKETS) if seconds <= bound),
+            len(LATENCY_BUCKETS),
+        )
+        self.bucket_counts[index] += 1
+        self.count += 1
+        self.latency_sum += seconds
+        self.latency_max = max(self.latency_max, seconds)
+        self.statuses[str(status)] += 1
+        self.bytes_received += size
+
+    def merge(self, other: "EndpointStats"):
+        """Adds another set of counters for the same endpoint to this one."""
+        self.bucket_counts = [a + b for a, b in zip(self.bucket_counts, other.bucket_counts)]
+        self.count += other.count
+        self.latency_sum += other.latency_sum
+        self.latency_max = max(self.latency_max, other.latency_max)
+        self.statuses.update(other.statuses)
+        self.bytes_received += other.bytes_received
+        self.retries += other.retries
+        self.rate_limit_waits += other.rate_limit_waits
+        self.rate_limit_wait_seconds += other.rate_limit_wait_seconds
+
+    def quantile(self, q: float) -> float:
+        """Estimates a latency quantile as the upper bound of its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.bucket_counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.latency_max
+
+
+class MetricsRegistry:
+    """
+    Thread-safe collection of `EndpointStats` keyed by "METHOD /template".
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointStats] = {}
+
+    def _stats(self, endpoint: str) -> EndpointStats:
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints[endpoint] = EndpointStats()
+        return stats
+
+    def observe(self, endpoint: str, seconds: float, status: int | str, size: int = 0):
+        """Records one HTTP attempt; `status` is the code or the transport error name."""
+        with self._lock:
+            self._stats(endpoint).observe(seconds, status, size)
+
+    def record_retry(self, endpoint: str):
+        with self._lock:
+            self._stats(endpoint).retries += 1
+
+    def record_rate_limit_wait(self, endpoint: str, seconds: float):
+        with self._lock:
+            stats = self._stats(endpoint)
+            stats.rate_limit_waits += 1
+            stats.rate_limit_wait_seconds += seconds
+
+    def export(self) -> Dict[str, EndpointStats]:
+        """Copies of the raw per-endpoint counters, e.g. to send from a worker process."""
+        with self._lock:
+            return copy.deepcopy(self._endpoints)
+
+    def merge(self, endpoints: Dict[str, EndpointStats]):
+        """Adds counters exported by another registry to this one."""
+        with self._lock:
+            for endpoint, stats in endpoints.items():
+                self._stats(endpoint).merge(stats)
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+    def summary(self) -> dict:
+        """Per-endpoint totals as plain JSON-serializable data."""
+        with self._lock:
+            return {
+                endpoint: {
+                    "calls": stats.count,
+                    "mean_ms": round(stats.latency_sum / stats.count * 1000, 1) if stats.count else 0.0,
+                    "p95_ms_le": round(stats.quantile(0.95) * 1000, 1),
+                    "max_ms": round(stats.latency_max * 1000, 1),
+                    "statuses": dict(stats.statuses),
+                    "bytes_received": stats.bytes_received,
+                    "retries": stats.retries,
+                    "rate_limit_waits": stats.rate_limit_waits,
+                    "rate_limit_wait_seconds": round(stats.rate_limit_wait_seconds, 3),
+                }
+                for endpoint, stats in sorted(self._endpoints.items())
+            }
+
+    def render_prometheus(self, gauges: Dict[str, float] | None = None) -> str:
+        """Renders the Prometheus text exposition format.
+
+        Args:
+            gauges (Dict[str, float], optional): Extra unlabelled values to export, by metric name.
+
+        Returns:
+            str: The metrics page.
+        """
+        lines = [
+            "# TYPE trello_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            for endpoint, stats in endpoints:
+                labels = _labels(endpoint)
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, stats.bucket_counts):
+                    cumulative += count
+                    lines.append(f'trello_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'trello_request_duration_seconds_bucket{{{labels},le="+Inf"}} {stats.count}')
+                lines.append(f"trello_request_duration_seconds_sum{{{labels}}} {stats.latency_sum:.6f}")
+                lines.append(f"trello_request_duration_seconds_count{{{labels}}} {stats.count}")
+
+            lines.append("# TYPE trello_responses_total counter")
+            for endpoint, stats in endpoints:
+                for status, count in sorted(stats.statuses.items()):
+                    lines.append(f'trello_responses_total{{{_labels(endpoint)},status="{status}"}} {count}')
+
+            for name, attribute in (
+                ("trello_response_bytes_total", "bytes_received"),
+                ("trello_retries_total", "retries"),
+                ("trello_rate_limit_waits_total", "rate_limit_waits"),
+                ("trello_rate_limit_wait_seconds_total", "rate_limit_wait_seconds"),
+            ):
+                lines.append(f"# TYPE {name} counter")
+                for endpoint, stats in endpoints:
+                    lines.append(f"{name}{{{_labels(endpoint)}}} {getattr(stats, attribute)}")
+
+        for name, value in (gauges or {}).items():
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(endpoint: str) -> str:
+    method, _, path = endpoint.partition(" ")
+    return f'method="{method}",endpoint="{path}"'
+
+
+default_registry = MetricsRegistry()
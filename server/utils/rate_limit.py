@@ -0,0 +1,177 @@
+# rate_limit.py
+"""
+Client-side rate limiting for the Trello API.
+
+Trello allows roughly 300 requests per 10 seconds per API key and 100 requests
+per 10 seconds per token. Every client built from the same key/token shares
+one limiter, so the MCP server and the weekly sync stay inside one budget.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+logger = logging.getLogger(__name__)
+
+KEY_LIMIT = 300
+TOKEN_LIMIT = 100
+LIMIT_INTERVAL = 10.0
+
+# How many times a request is re-queued after an HTTP 429 before giving up
+MAX_RATE_LIMIT_RETRIES = 5
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at `capacity / interval` tokens per second.
+
+    Callers reserve a token up front and are told how long to wait for it, so
+    waiting requests are served in the order they asked.
+    """
+
+    def __init__(self, capacity: int, interval: float):
+        self.capacity = capacity
+        self.interval = interval
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / self.interval
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def reserve(self, now: float) -> float:
+        """Takes one token and returns the seconds to wait before it is usable."""
+        self._refill(now)
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def sync(self, remaining: int, now: float):
+        """Never believe we have more tokens than the server says we do."""
+        self._refill(now)
+        self.tokens = min(self.tokens, float(remaining))
+
+
+class RateLimiter:
+    """
+    Enforces the per-key and per-token budgets and pauses after HTTP 429.
+
+    Safe to use from threads (`acquire`) and from asyncio code (`acquire_async`).
+    """
+
+    def __init__(self, key_bucket: TokenBucket, token_bucket: TokenBucket):
+        self.key_bucket = key_bucket
+        self.token_bucket = token_bucket
+        self._lock = threading.Lock()
+        self._blocked_until = 0.0
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            delay = max(
+                self._blocked_until - now,
+                self.key_bucket.reserve(now),
+                self.token_bucket.reserve(now),
+                0.0,
+            )
+            if delay > 0:
+                self.waits += 1
+                self.wait_seconds += delay
+            return delay
+
+    def acquire(self) -> float:
+        """Blocks the current thread until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self) -> float:
+        """Waits without blocking the event loop until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def share(self, key_share: float, token_share: float):
+        """Scales the budgets down to this process's share of them.
+
+        Limiters are per process, so processes sending requests with the same
+        key or token have to split its budget between them.
+
+        Args:
+            key_share (float): Fraction of the per-key budget this process may use.
+            token_share (float): Fraction of the per-token budget this process may use.
+        """
+        with self._lock:
+            for bucket, limit, share in (
+                (self.key_bucket, KEY_LIMIT, key_share),
+                (self.token_bucket, TOKEN_LIMIT, token_share),
+            ):
+                bucket.capacity = max(1, int(limit * share))
+                bucket.tokens = min(bucket.tokens, float(bucket.capacity))
+
+    def update_from_headers(self, headers):
+        """Syncs the buckets with Trello's `x-rate-limit-*` response headers."""
+        now = time.monotonic()
+        with self._lock:
+            for scope, bucket in (("key", self.key_bucket), ("token", self.token_bucket)):
+                remaining = headers.get(f"x-rate-limit-api-{scope}-remaining")
+                if remaining is None:
+                    continue
+                try:
+                    bucket.sync(int(remaining), now)
+                except ValueError:
+                    continue
+
+    def backoff(self, retry_after: float | None = None):
+        """Holds back every request for `retry_after` seconds (or one full interval)."""
+        pause = retry_after if retry_after is not None else self.token_bucket.interval
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + pause)
+        logger.warning(f"Trello rate limit hit, pausing requests for {pause:.1f}s")
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parses a `Retry-After` header given either in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+_registry_lock = threading.Lock()
+_key_buckets: dict[str, TokenBucket] = {}
+_limiters: dict[tuple[str, str], RateLimiter] = {}
+
+
+def get_rate_limiter(api_key: str, token: str) -> RateLimiter:
+    """Returns the process-wide limiter for a key/token pair.
+
+    Limiters for different tokens of the same key share the per-key bucket.
+    """
+    with _registry_lock:
+        limiter = _limiters.get((api_key, token))
+        if limiter is None:
+            key_bucket = _key_buckets.get(api_key)
+            if key_bucket is None:
+                key_bucket = _key_buckets[api_key] = TokenBucket(KEY_LIMIT, LIMIT_INTERVAL)
+            limiter = RateLimiter(key_bucket, TokenBucket(TOKEN_LIMIT, LIMIT_INTERVAL))
+            _limiters[(api_key, token)] = limiter
+        return limiter
@@ -0,0 +1,54 @@
+# retry.py
+"""
+Retry policy for transient Trello API failures.
+"""
+
+import random
+
+import httpx
+
+# Methods that are safe to send twice
+IDEMPOTENT_METHODS = {"GET", "PUT", "DELETE"}
+
+RETRY_STATUSES = {500, 502, 503, 504}
+
+
+class RetryPolicy:
+    """
+    Capped exponential backoff with full jitter.
+
+    Idempotent verbs are retried automatically. POST is only retried when the
+    caller opts in, either per call or with `retry_post=True`, because a POST
+    that timed out may already have been applied.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        retry_post: bool = False,
+        retry_statuses: set[int] | None = None,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_post = retry_post
+        self.retry_statuses = retry_statuses or RETRY_STATUSES
+
+    def allows(self, method: str, retry: bool | None = None) -> bool:
+        """Whether a request with this method may be retried at all."""
+        if retry is not None:
+            return retry
+        return method in IDEMPOTENT_METHODS or (method == "POST" and self.retry_post)
+
+    def is_transient(self, response: httpx.Response | None = None, error: Exception | None = None) -> bool:
+        """Whether a response status or transport error is worth another attempt."""
+        if error is not None:
+            return isinstance(error, httpx.TransportError)
+        return response is not None and response.status_code in self.retry_statuses
+
+    def backoff(self, attempt: int) -> float:
+        """Seconds to sleep before retry number `attempt` (starting at 0)."""
+        cap = min(self.max_delay, self.base_delay * (2**attempt))
+        return random.uniform(0, cap)
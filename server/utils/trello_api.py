@@ -1,36 +1,234 @@
 # trello_api.py
+import asyncio
 import logging
+import re
+import time
+from collections import Counter, OrderedDict
+from typing import Any
 
 import httpx
 
+from server.utils.metrics import MetricsRegistry, default_registry
+from server.utils.rate_limit import (
+    MAX_RATE_LIMIT_RETRIES,
+    get_rate_limiter,
+    parse_retry_after,
+)
+from server.utils.retry import RetryPolicy
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 TRELLO_API_BASE = "https://api.trello.com/1"
 
+_ID_SEGMENT = re.compile(r"(?<=/)[0-9a-fA-F]{24}(?=/|$)")
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Collapses Trello object IDs in a path, e.g. `/cards/5f1.../labels` -> `/cards/{id}/labels`."""
+    return _ID_SEGMENT.sub("{id}", "/" + endpoint.lstrip("/"))
+
+
+def _h2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
 
 class TrelloClient:
     """
     Client class for interacting with the Trello API over REST.
     """
 
-    def __init__(self, api_key: str, token: str):
+    def __init__(
+        self,
+        api_key: str,
+        token: str,
+        retry_policy: RetryPolicy | None = None,
+        http2: bool = False,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        etag_cache_size: int = 256,
+        metrics: MetricsRegistry | None = None,
+        timeout: float | None = 5.0,
+    ):
         self.api_key = api_key
         self.token = token
         self.base_url = TRELLO_API_BASE
-        self.client = httpx.AsyncClient(base_url=self.base_url)
+        if http2 and not _h2_available():
+            logger.warning("HTTP/2 requested but the 'h2' package is not installed, using HTTP/1.1")
+            http2 = False
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=http2,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+        )
+        self.rate_limiter = get_rate_limiter(api_key, token)
+        self.retry_policy = retry_policy or RetryPolicy()
+        # Retries per "METHOD /endpoint/{id}" template
+        self.retry_counts = Counter()
+        # Latency, statuses, bytes, retries and rate-limit waits per endpoint template
+        self.metrics = metrics or default_registry
+        # Validators and parsed bodies of recent GETs, for conditional requests
+        self.etag_cache_size = etag_cache_size
+        self._validated: OrderedDict[str, tuple[dict, Any]] = OrderedDict()
+        self.not_modified = 0
 
     async def close(self):
         await self.client.aclose()
 
-    async def GET(self, endpoint: str, params: dict = None):
+    async def _send(
+        self, method: str, endpoint: str, retry: bool | None = None, **kwargs
+    ) -> httpx.Response:
+        """Sends a request within the rate limit, retrying transient failures.
+
+        HTTP 429 is always re-queued behind the rate limiter since the request
+        was not processed. 5xx responses and transport errors are retried with
+        backoff when the retry policy allows it for this method.
+        """
+        retryable = self.retry_policy.allows(method, retry)
+        template = f"{method} {endpoint_template(endpoint)}"
+        throttled = 0
+        attempt = 0
+        while True:
+            waited = await self.rate_limiter.acquire_async()
+            if waited > 0:
+                self.metrics.record_rate_limit_wait(template, waited)
+            start = time.perf_counter()
+            try:
+                response = await self.client.request(method, endpoint, **kwargs)
+            except httpx.TransportError as e:
+                self.metrics.observe(template, time.perf_counter() - start, type(e).__name__)
+                if not retryable or attempt >= self.retry_policy.max_retries:
+                    raise
+                reason = type(e).__name__
+            else:
+                self.metrics.observe(
+                    template,
+                    time.perf_counter() - start,
+                    response.status_code,
+                    len(response.content),
+                )
+                self.rate_limiter.update_from_headers(response.headers)
+                if response.status_code == 429 and throttled < MAX_RATE_LIMIT_RETRIES:
+                    throttled += 1
+                    self._count_retry(method, endpoint)
+                    self.rate_limiter.backoff(
+                        parse_retry_after(response.headers.get("Retry-After"))
+                    )
+                    continue
+                if (
+                    not retryable
+                    or attempt >= self.retry_policy.max_retries
+                    or not self.retry_policy.is_transient(response)
+                ):
+                    return response
+                reason = f"HTTP {response.status_code}"
+
+            delay = self.retry_policy.backoff(attempt)
+            attempt += 1
+            self._count_retry(method, endpoint)
+            logger.warning(
+                f"{method} {endpoint} failed ({reason}), retry {attempt}/"
+                f"{self.retry_policy.max_retries} in {delay:.2f}s"
+            )
+            await asyncio.sleep(delay)
+
+    def _count_retry(self, method: str, endpoint: str):
+        template = f"{method} {endpoint_template(endpoint)}"
+        self.retry_counts[template] += 1
+        self.metrics.record_retry(template)
+
+    def _validator_key(self, endpoint: str, params: dict | None, raw: bool) -> str:
+        return ("raw:" if raw else "") + endpoint + "?" + "&".join(
+            f"{name}={value}" for name, value in sorted((params or {}).items())
+        )
+
+    def _remember(self, key: str, response: httpx.Response, body: Any):
+        validators = {}
+        if "ETag" in response.headers:
+            validators["If-None-Match"] = response.headers["ETag"]
+        if "Last-Modified" in response.headers:
+            validators["If-Modified-Since"] = response.headers["Last-Modified"]
+        if not validators or self.etag_cache_size <= 0:
+            self._validated.pop(key, None)
+            return
+        self._validated[key] = (validators, body)
+        self._validated.move_to_end(key)
+        while len(self._validated) > self.etag_cache_size:
+            self._validated.popitem(last=False)
+
+    async def _get(self, endpoint: str, params: dict | None, raw: bool):
         all_params = {"key": self.api_key, "token": self.token}
         if params:
             all_params.update(params)
+        key = self._validator_key(endpoint, params, raw)
+        cached = self._validated.get(key)
+        response = await self._send(
+            "GET",
+            endpoint,
+            params=all_params,
+            headers=cached[0] if cached else None,
+        )
+        if response.status_code == 304 and cached:
+            self._validated.move_to_end(key)
+            self.not_modified += 1
+            return cached[1]
+        response.raise_for_status()
+        body = response.content if raw else response.json()
+        self._remember(key, response, body)
+        return body
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None = None,
+        data: dict | None = None,
+        retry: bool | None = None,
+    ):
+        """Sends any request with `params` in the query string and returns the decoded body.
+
+        Unlike the verb helpers, errors are raised unchanged and not logged, so
+        callers that expect some failures (e.g. 404 for deleted cards) decide
+        how to report them. GETs are conditional like `GET`. An empty response
+        body is returned as `{}`.
+
+        Raises:
+            httpx.HTTPStatusError: On an error status after retries.
+            httpx.RequestError: On a transport error after retries.
+        """
+        if method == "GET":
+            return await self._get(endpoint, params, raw=False)
+        all_params = {"key": self.api_key, "token": self.token}
+        if params:
+            all_params.update(params)
+        response = await self._send(
+            method, endpoint, retry=retry, params=all_params, json=data
+        )
+        response.raise_for_status()
+        return response.json() if response.content else {}
+
+    async def GET(self, endpoint: str, params: dict = None, raw: bool = False):
+        """Sends a GET, revalidating a previously seen response when possible.
+
+        Responses carrying an `ETag` or `Last-Modified` header are remembered
+        per URL. The next GET of that URL is conditional, and on `304 Not
+        Modified` the previously parsed body is returned without downloading
+        or parsing it again. The returned object is shared, so callers must
+        not mutate it.
+
+        With `raw=True` the undecoded response body is returned as bytes, for
+        callers that validate JSON straight into models.
+        """
         try:
-            response = await self.client.get(endpoint, params=all_params)
-            response.raise_for_status()
-            return response.json()
+            return await self._get(endpoint, params, raw)
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error: {e}")
             raise httpx.HTTPStatusError(
@@ -42,10 +240,12 @@ class TrelloClient:
             logger.error(f"Request error: {e}")
             raise httpx.RequestError(f"Failed to get {endpoint}: {str(e)}")
 
-    async def POST(self, endpoint: str, data: dict = None):
+    async def POST(self, endpoint: str, data: dict = None, retry: bool | None = None):
         all_params = {"key": self.api_key, "token": self.token}
         try:
-            response = await self.client.post(endpoint, params=all_params, json=data)
+            response = await self._send(
+                "POST", endpoint, retry=retry, params=all_params, json=data
+            )
             response.raise_for_status()
             return response.json()
         except httpx.HTTPStatusError as e:
@@ -62,7 +262,7 @@ class TrelloClient:
     async def PUT(self, endpoint: str, data: dict = None):
         all_params = {"key": self.api_key, "token": self.token}
         try:
-            response = await self.client.put(endpoint, params=all_params, json=data)
+            response = await self._send("PUT", endpoint, params=all_params, json=data)
             response.raise_for_status()
             return response.json()
         except httpx.HTTPStatusError as e:
@@ -81,7 +281,7 @@ class TrelloClient:
         if params:
             all_params.update(params)
         try:
-            response = await self.client.delete(endpoint, params=all_params)
+            response = await self._send("DELETE", endpoint, params=all_params)
             response.raise_for_status()
             return response.json()
         except httpx.HTTPStatusError as e:
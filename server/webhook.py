@@ -0,0 +1,203 @@
+"""
+Trello webhook receiver that keeps the Weekly Milestone board in sync in real time.
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import logging
+from collections import OrderedDict
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+logger = logging.getLogger(__name__)
+
+# Card actions that can change what belongs on the Weekly board
+SYNC_ACTION_TYPES = {
+    "addLabelToCard",
+    "removeLabelFromCard",
+    "updateCard",
+    "deleteCard",
+    "createCard",
+    "copyCard",
+    "moveCardToBoard",
+    "convertToCardFromCheckItem",
+}
+
+# How many recent action IDs are remembered to drop Trello's redeliveries
+SEEN_ACTIONS_LIMIT = 5000
+
+
+def verify_trello_signature(
+    body: bytes, callback_url: str, secret: str, signature: str | None
+) -> bool:
+    """Checks the `X-Trello-Webhook` header.
+
+    Trello signs each delivery with base64(HMAC-SHA1(app secret, body + callback URL)).
+
+    Args:
+        body (bytes): The raw request body.
+        callback_url (str): The callback URL the webhook was registered with.
+        secret (str): The Trello application secret.
+        signature (str | None): The value of the `X-Trello-Webhook` header.
+
+    Returns:
+        bool: Whether the signature matches.
+    """
+    if not signature:
+        return False
+    digest = hmac.new(
+        secret.encode(), body + callback_url.encode(), hashlib.sha1
+    ).digest()
+    return hmac.compare_digest(base64.b64encode(digest).decode(), signature)
+
+
+class WeeklySyncWebhook:
+    """
+    Receives Trello webhook deliveries and applies the weekly sync to the affected card.
+
+    Events are deduplicated by action ID and coalesced per card: a card that
+    changes several times before a worker gets to it is synced once. Cards are
+    sharded across a fixed number of workers, each with its own bounded queue,
+    so one card is never synced by two workers at the same time and a burst of
+    events never blocks the server. Mapping changes are saved from a thread at
+    most once every `save_delay` seconds instead of after every event.
+    """
+
+    def __init__(
+        self,
+        sync,
+        secret: str,
+        callback_url: str,
+        workers: int = 2,
+        queue_size: int = 1000,
+        save_delay: float = 2.0,
+    ):
+        self.sync = sync
+        self.secret = secret
+        self.callback_url = callback_url
+        self.queues = [asyncio.Queue(maxsize=queue_size) for _ in range(max(1, workers))]
+        self._pending: set[str] = set()
+        self._seen_actions: OrderedDict[str, None] = OrderedDict()
+        self._worker_tasks: list[asyncio.Task] = []
+        self.save_delay = save_delay
+        self._save_task: asyncio.Task | None = None
+        self._dirty = False
+
+    async def start(self):
+        """Starts the worker tasks."""
+        await self.sync.load_lists()
+        # The sync's own writes come back as events too. They aren't filtered out by member:
+        # the token is usually the board owner's, whose changes by hand must be synced, and
+        # an echoed write plans nothing since sync_card works from fresh reads
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(queue)) for queue in self.queues
+        ]
+        logger.info(f"Weekly sync webhook started with {len(self.queues)} workers")
+
+    async def stop(self):
+        """Cancels the worker tasks, saves the mappings and closes the sync's connections."""
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        if self._save_task:
+            self._save_task.cancel()
+            await asyncio.gather(self._save_task, return_exceptions=True)
+            self._save_task = None
+        await self.sync.save_mapping_async()
+        await self.sync.close()
+
+    async def handle(self, request: Request) -> Response:
+        """Starlette endpoint for Trello webhook deliveries."""
+        # Trello sends a HEAD request when the webhook is registered
+        if request.method == "HEAD":
+            return Response(status_code=200)
+
+        body = await request.body()
+        if not verify_trello_signature(
+            body, self.callback_url, self.secret, request.headers.get("X-Trello-Webhook")
+        ):
+            logger.warning("Rejected webhook delivery with invalid signature")
+            return Response(status_code=401)
+
+        try:
+            payload = await request.json()
+        except ValueError:
+            return Response(status_code=400)
+
+        if not self.enqueue(payload.get("action") or {}):
+            # Ask Trello to redeliver later instead of dropping the event
+            return Response(status_code=503)
+        return JSONResponse({"status": "accepted"})
+
+    def enqueue(self, action: dict) -> bool:
+        """Queues the card an action refers to. Returns False if the queue is full."""
+        action_id = action.get("id")
+        card_id = action.get("data", {}).get("card", {}).get("id")
+        board_id = action.get("data", {}).get("board", {}).get("id")
+        if action.get("type") not in SYNC_ACTION_TYPES or not card_id or not board_id:
+            return True
+
+        if action_id:
+            if action_id in self._seen_actions:
+                return True
+            self._seen_actions[action_id] = None
+            if len(self._seen_actions) > SEEN_ACTIONS_LIMIT:
+                self._seen_actions.popitem(last=False)
+
+        key = self._card_key(card_id, board_id)
+        if key in self._pending:
+            # Already waiting; the worker will read the card's latest state anyway
+            return True
+
+        queue = self.queues[hash(key) % len(self.queues)]
+        try:
+            queue.put_nowait((key, card_id, board_id))
+        except asyncio.QueueFull:
+            logger.warning(f"Webhook queue full, deferring card {card_id}")
+            if action_id:
+                self._seen_actions.pop(action_id, None)
+            return False
+        self._pending.add(key)
+        return True
+
+    def _card_key(self, card_id: str, board_id: str) -> str:
+        # Both sides of a mapped card share a key so they land on the same worker
+        if board_id == self.sync.weekly_board_id:
+            mapping = self.sync.find_mapping(weekly_card_id=card_id)
+            if mapping:
+                return mapping["original_card_id"]
+        return card_id
+
+    async def _worker(self, queue: asyncio.Queue):
+        while True:
+            key, card_id, board_id = await queue.get()
+            self._pending.discard(key)
+            try:
+                await self.sync.sync_card(card_id, board_id)
+            except Exception as e:
+                logger.error(f"Failed to sync card {card_id} from webhook: {str(e)}")
+            finally:
+                self._schedule_save()
+                queue.task_done()
+
+    def _schedule_save(self):
+        # One saver at a time; events that arrive while it waits or writes are picked up by its next pass
+        self._dirty = True
+        if self._save_task is None:
+            self._save_task = asyncio.create_task(self._saver())
+
+    async def _saver(self):
+        try:
+            while self._dirty:
+                await asyncio.sleep(self.save_delay)
+                self._dirty = False
+                try:
+                    await self.sync.save_mapping_async()
+                except Exception as e:
+                    logger.error(f"Failed to save weekly sync mappings: {str(e)}")
+        finally:
+            self._save_task = None
@@ -0,0 +1,22 @@
+import os
+import sys
+
+# The tests import the server and sync modules and the benchmarks' mock Trello server
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import pytest  # noqa: E402
+
+from fake_trello import FakeTrello, start_server  # noqa: E402
+from sync_scenario import Scenario  # noqa: E402
+
+
+@pytest.fixture
+def scenario(tmp_path, monkeypatch):
+    for name in ("WEEKLY_BOARD_ID", "SYNC_MODE", "DISCOVERY_MODE", "SYNC_SHARDS", "MAPPING_BACKEND"):
+        monkeypatch.delenv(name, raising=False)
+    trello = FakeTrello()
+    server, base_url = start_server(trello)
+    yield Scenario(trello, base_url, tmp_path, monkeypatch)
+    server.shutdown()
@@ -0,0 +1,255 @@
+"""
+In-memory stand-in for the parts of the Trello REST API the weekly sync uses.
+
+Unlike benchmarks/mock_trello.py, which answers every GET with the same card,
+this keeps real boards, lists, labels, cards, comments and actions, so whole
+sync runs can be replayed against it and their effects inspected. Every
+request is recorded in `calls` as (method, path, params).
+"""
+
+import itertools
+import json
+import re
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeTrello:
+    """The state behind one fake server."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self.boards: dict[str, dict] = {}
+        self.lists: dict[str, dict] = {}
+        self.labels: dict[str, dict] = {}
+        self.cards: dict[str, dict] = {}
+        self.comments: list[tuple[str, str]] = []
+        self.actions: list[dict] = []
+        self.calls: list[tuple[str, str, dict]] = []
+        # The member every token belongs to
+        self.member_id = self.new_id()
+        # When set, POST /cards answers 500
+        self.fail_card_creates = False
+        # Members who aren't on the Weekly board: POST /cards with any of them answers 400
+        self.outside_members: set[str] = set()
+        # GETs of these cards, alone or in a batch, answer 500
+        self.unreadable_cards: set[str] = set()
+
+    def new_id(self) -> str:
+        return "%024x" % (0x65000000 << 64 | next(self._ids))
+
+    def add_board(self, name: str, org: str | None = None) -> str:
+        board_id = self.new_id()
+        self.boards[board_id] = {"id": board_id, "name": name, "idOrganization": org}
+        return board_id
+
+    def add_list(self, board_id: str, name: str) -> str:
+        list_id = self.new_id()
+        self.lists[list_id] = {"id": list_id, "name": name, "idBoard": board_id, "closed": False}
+        return list_id
+
+    def add_label(self, board_id: str, name: str, color: str | None = "orange") -> str:
+        label_id = self.new_id()
+        self.labels[label_id] = {"id": label_id, "name": name, "color": color, "idBoard": board_id}
+        return label_id
+
+    def add_card(
+        self,
+        list_id: str,
+        name: str,
+        label_ids=(),
+        members=(),
+        desc: str = "",
+        due: str | None = None,
+        closed: bool = False,
+    ) -> str:
+        card_id = self.new_id()
+        self.cards[card_id] = {
+            "id": card_id,
+            "name": name,
+            "desc": desc,
+            "idList": list_id,
+            "idBoard": self.lists[list_id]["idBoard"],
+            "idLabels": list(label_ids),
+            "idMembers": list(members),
+            "due": due,
+            "closed": closed,
+            "shortUrl": f"https://trello.com/c/{card_id[-8:]}",
+        }
+        return card_id
+
+    def add_action(self, action_type: str, board_id: str, card_id: str, date: str, **data):
+        self.actions.append({
+            "id": self.new_id(),
+            "type": action_type,
+            "date": date,
+            "data": {"board": {"id": board_id}, "card": {"id": card_id}, **data},
+        })
+
+    def cards_on(self, board_id: str) -> list[dict]:
+        return [card for card in self.cards.values() if card["idBoard"] == board_id]
+
+    def label_names(self, card: dict) -> list[str]:
+        return sorted(self.labels[label_id]["name"] for label_id in card["idLabels"] if label_id in self.labels)
+
+    def writes(self) -> list[tuple[str, str]]:
+        """Every request that changed something, as (method, path), in the order received."""
+        return [(method, path) for method, path, _ in self.calls if method != "GET"]
+
+    def card_view(self, card: dict, fields: str | None = None) -> dict:
+        view = dict(card, labels=[self.labels[label_id] for label_id in card["idLabels"] if label_id in self.labels])
+        if fields and fields != "all":
+            keep = set(fields.split(",")) | {"id"}
+            view = {name: value for name, value in view.items() if name in keep}
+        return view
+
+    def dispatch(self, method: str, path: str, params: dict) -> tuple[int, object]:
+        """Answers one request; raises KeyError for unknown IDs."""
+        match = lambda pattern: re.fullmatch(pattern, path)  # noqa: E731
+
+        if method == "GET":
+            if path == "/members/me":
+                return 200, {"id": self.member_id}
+            if path == "/members/me/boards":
+                return 200, [dict(board) for board in self.boards.values()]
+            if route := match(r"/boards/(\w+)/cards"):
+                return 200, [
+                    self.card_view(card, params.get("fields"))
+                    for card in self.cards_on(route.group(1))
+                    if params.get("filter") == "all" or not card["closed"]
+                ]
+            if route := match(r"/boards/(\w+)/lists"):
+                return 200, [item for item in self.lists.values() if item["idBoard"] == route.group(1)]
+            if route := match(r"/boards/(\w+)/labels"):
+                return 200, [label for label in self.labels.values() if label["idBoard"] == route.group(1)]
+            if route := match(r"/boards/(\w+)/actions"):
+                types = set(params["filter"].split(",")) if params.get("filter") else None
+                since = params.get("since")
+                return 200, [
+                    action for action in reversed(self.actions)
+                    if action["data"]["board"]["id"] == route.group(1)
+                    and (not since or action["date"] > since)
+                    and (types is None or action["type"] in types)
+                ]
+            if route := match(r"/boards/(\w+)"):
+                return 200, self.boards[route.group(1)]
+            if path == "/search":
+                # Like Trello, archived cards are only left out when the query asks for open ones
+                query = params.get("query", "")
+                name = re.search(r'label:"([^"]+)"', query).group(1)
+                board_ids = params.get("idBoards", "").split(",")
+                return 200, {"cards": [
+                    self.card_view(card, params.get("card_fields"))
+                    for card in self.cards.values()
+                    if card["idBoard"] in board_ids
+                    and not (card["closed"] and "is:open" in query)
+                    and name in self.label_names(card)
+                ]}
+            if path == "/batch":
+                results = []
+                for url in params["urls"].split(","):
+                    route = urllib.parse.urlparse(urllib.parse.unquote(url))
+                    route_params = {k: v[-1] for k, v in urllib.parse.parse_qs(route.query).items()}
+                    try:
+                        status, body = self.dispatch("GET", route.path, route_params)
+                    except KeyError:
+                        status, body = 404, "not found"
+                    results.append({str(status): body} if status == 200 else {"message": body, "statusCode": status})
+                return 200, results
+
+        if route := match(r"/cards/(\w+)"):
+            card = self.cards[route.group(1)]
+            if method == "GET":
+                if card["id"] in self.unreadable_cards:
+                    return 500, {"message": "server error"}
+                return 200, self.card_view(card, params.get("fields"))
+            if method == "PUT":
+                card.update({name: params[name] for name in ("idList", "name", "closed", "desc", "due") if name in params})
+                return 200, self.card_view(card)
+            if method == "DELETE":
+                del self.cards[card["id"]]
+                return 200, {"limits": {}}
+
+        if method == "POST":
+            if path == "/cards":
+                if self.fail_card_creates:
+                    return 500, {"message": "server error"}
+                members = [member for member in params.get("idMembers", "").split(",") if member]
+                if self.outside_members.intersection(members):
+                    return 400, {"message": "invalid value for idMembers"}
+                card_id = self.add_card(
+                    params["idList"],
+                    params["name"],
+                    label_ids=[label_id for label_id in params.get("idLabels", "").split(",") if label_id],
+                    members=members,
+                    desc=params.get("desc", ""),
+                    due=params.get("due"),
+                )
+                return 200, self.card_view(self.cards[card_id])
+            if route := match(r"/cards/(\w+)/idLabels"):
+                self.cards[route.group(1)]["idLabels"].append(params["value"])
+                return 200, self.cards[route.group(1)]["idLabels"]
+            if route := match(r"/cards/(\w+)/labels"):
+                card = self.cards[route.group(1)]
+                card["idLabels"].append(self.add_label(card["idBoard"], params["name"], params.get("color")))
+                return 200, card["idLabels"]
+            if route := match(r"/cards/(\w+)/idMembers"):
+                self.cards[route.group(1)]["idMembers"].append(params["value"])
+                return 200, []
+            if route := match(r"/cards/(\w+)/actions/comments"):
+                self.comments.append((self.cards[route.group(1)]["id"], params["text"]))
+                return 200, {"id": self.new_id()}
+            if path == "/labels":
+                label_id = self.add_label(params["idBoard"], params["name"], params.get("color"))
+                return 200, self.labels[label_id]
+
+        return 404, {"message": f"no route {method} {path}"}
+
+
+class FakeTrelloHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self):
+        url = urllib.parse.urlparse(self.path)
+        params = {k: v[-1] for k, v in urllib.parse.parse_qs(url.query, keep_blank_values=True).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            try:
+                body = json.loads(self.rfile.read(length))
+            except ValueError:
+                body = None
+            if isinstance(body, dict):
+                params.update({k: v for k, v in body.items() if v is not None})
+        path = url.path.removeprefix("/1")
+
+        trello = self.server.trello
+        with trello.lock:
+            trello.calls.append((self.command, path, dict(params)))
+            try:
+                status, body = trello.dispatch(self.command, path, params)
+            except KeyError:
+                status, body = 404, {"message": "not found"}
+
+        raw = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+
+def start_server(trello: FakeTrello):
+    """Serves `trello` on a free local port and returns (server, base_url)."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeTrelloHandler)
+    server.daemon_threads = True
+    server.trello = trello
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/1"
@@ -0,0 +1,93 @@
+"""
+Project boards and a Weekly board on the fake Trello, and the weekly sync pointed at them.
+"""
+
+import asyncio
+import itertools
+import json
+
+from fake_trello import FakeTrello
+from weekly_milestone_sync import TrelloWeeklySync
+
+TRIGGER_LABEL = "This Week"
+
+# Every sync gets its own key and token, so no test waits on another's rate budget
+_credentials = itertools.count()
+
+
+class Scenario:
+    """Project boards with labelled cards, the Weekly board, and a way to run the sync on them."""
+
+    def __init__(self, trello: FakeTrello, base_url: str, tmp_path, monkeypatch):
+        self.trello = trello
+        self.base_url = base_url
+        self.monkeypatch = monkeypatch
+        self.mapping_path = str(tmp_path / "weekly_sync_mapping.json")
+
+        self.weekly = trello.add_board("Weekly Milestone")
+        self.this_week = trello.add_list(self.weekly, "This Week")
+        self.completed = trello.add_list(self.weekly, "Completed")
+
+        # Board 2 has no trigger label at all; on the others the first two cards carry it
+        self.cards: dict[str, str] = {}
+        self.trigger_labels: dict[int, str] = {}
+        self.doing_lists: dict[int, str] = {}
+        for number in range(4):
+            board = trello.add_board(f"Project {number}", org="org-a" if number % 2 else "org-b")
+            self.doing_lists[number] = trello.add_list(board, "Doing")
+            if number != 2:
+                self.trigger_labels[number] = trello.add_label(board, TRIGGER_LABEL)
+            bug = trello.add_label(board, "Bug", "red")
+            for position in range(3):
+                labels = [bug]
+                if number in self.trigger_labels and position < 2:
+                    labels.append(self.trigger_labels[number])
+                name = f"P{number}-C{position}"
+                self.cards[name] = trello.add_card(
+                    self.doing_lists[number],
+                    name,
+                    labels,
+                    members=["member-1"] if position == 0 else [],
+                    desc=f"Details of {name}",
+                )
+
+        self.config_path = str(tmp_path / "weekly_config.json")
+        with open(self.config_path, "w") as f:
+            json.dump({
+                "weekly_board_id": self.weekly,
+                "trigger_label": TRIGGER_LABEL,
+                "lists": {"this_week": self.this_week, "completed": self.completed},
+            }, f)
+
+    def make_sync(self) -> TrelloWeeklySync:
+        n = next(_credentials)
+        self.monkeypatch.setenv("TRELLO_API_KEY", f"test-key-{n}")
+        self.monkeypatch.setenv("TRELLO_API_TOKEN", f"test-token-{n}")
+        sync = TrelloWeeklySync(self.config_path, self.mapping_path)
+        sync.client.client.base_url = self.base_url
+        return sync
+
+    def run(self, dry_run: bool = False) -> TrelloWeeklySync:
+        """Run one full sync, recording only its own calls."""
+        sync = self.make_sync()
+        sync.dry_run = dry_run
+        self.trello.calls.clear()
+
+        async def run():
+            try:
+                await sync.run()
+            finally:
+                await sync.close()
+
+        asyncio.run(run())
+        return sync
+
+    def weekly_cards(self) -> dict[str, dict]:
+        return {card["name"]: card for card in self.trello.cards_on(self.weekly)}
+
+    def comments_on(self, name: str) -> list[str]:
+        return [text for card_id, text in self.trello.comments if card_id == self.cards[name]]
+
+    def remove_trigger_label(self, name: str):
+        card = self.trello.cards[self.cards[name]]
+        card["idLabels"] = [label_id for label_id in card["idLabels"] if label_id not in self.trigger_labels.values()]
@@ -0,0 +1,114 @@
+"""
+Request coalescing, cancellation and invalidation in AsyncTTLCache.
+"""
+
+import asyncio
+import gc
+
+from server.utils.cache import AsyncTTLCache
+
+
+class SlowFetch:
+    """A fetch that waits until released, counting how often it was started."""
+
+    def __init__(self, value="value"):
+        self.value = value
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if isinstance(self.value, Exception):
+            raise self.value
+        return self.value
+
+
+def test_concurrent_lookups_share_one_fetch():
+    async def run():
+        cache = AsyncTTLCache()
+        fetch = SlowFetch()
+        lookups = [asyncio.create_task(cache.get_or_fetch("/cards/1", fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        fetch.release.set()
+        return await asyncio.gather(*lookups), fetch.calls, cache.stats()
+
+    values, calls, stats = asyncio.run(run())
+
+    assert values == ["value"] * 3
+    assert calls == 1
+    assert (stats["misses"], stats["coalesced"], stats["size"]) == (1, 2, 1)
+
+
+def test_cancelling_the_first_caller_keeps_the_fetch_for_the_others():
+    async def run():
+        cache = AsyncTTLCache()
+        fetch = SlowFetch()
+        first = asyncio.create_task(cache.get_or_fetch("/cards/1", fetch))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(cache.get_or_fetch("/cards/1", fetch))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        fetch.release.set()
+        value = await second
+        # The value was still stored, so the next lookup is a hit
+        cached = await cache.get_or_fetch("/cards/1", fetch)
+        return first.cancelled(), value, cached, fetch.calls
+
+    first_cancelled, value, cached, calls = asyncio.run(run())
+
+    assert first_cancelled
+    assert value == cached == "value"
+    assert calls == 1
+
+
+def test_invalidate_during_fetch_keeps_the_result_out_of_the_cache():
+    async def run():
+        cache = AsyncTTLCache()
+        stale = SlowFetch("before the write")
+        lookup = asyncio.create_task(cache.get_or_fetch("/cards/1", stale, tags=["card:1"]))
+        await asyncio.sleep(0)
+
+        # A write to the card lands while it is being read
+        cache.invalidate("card:1")
+        stale.release.set()
+        value = await lookup
+
+        fresh = SlowFetch("after the write")
+        fresh.release.set()
+        return value, await cache.get_or_fetch("/cards/1", fresh), cache.stats()
+
+    value, next_value, stats = asyncio.run(run())
+
+    # The caller already waiting gets what was read, but the next lookup reads again
+    assert value == "before the write"
+    assert next_value == "after the write"
+    assert stats["misses"] == 2
+
+
+def test_failure_nobody_waits_for_is_not_reported():
+    errors = []
+
+    async def run():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+        cache = AsyncTTLCache()
+        fetch = SlowFetch(RuntimeError("Trello is down"))
+        lookup = asyncio.create_task(cache.get_or_fetch("/cards/1", fetch))
+        await asyncio.sleep(0)
+
+        # The only caller gives up before the fetch fails
+        lookup.cancel()
+        await asyncio.sleep(0)
+        fetch.release.set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        gc.collect()
+        return cache
+
+    cache = asyncio.run(run())
+
+    assert errors == []
+    assert cache.stats()["size"] == 0
+    assert not cache._inflight
@@ -0,0 +1,50 @@
+"""
+Conditional GETs of TrelloClient against the benchmarks' mock Trello server.
+"""
+
+import asyncio
+
+import pytest
+
+from mock_trello import CARD, start_server
+from server.utils.trello_api import TrelloClient
+
+CARD_ENDPOINT = f"/cards/{CARD['id']}"
+
+
+@pytest.fixture
+def base_url():
+    server, base_url = start_server()
+    yield base_url
+    server.shutdown()
+
+
+def read_twice(base_url: str, token: str, etag_cache_size: int):
+    async def read():
+        client = TrelloClient("test-key", token, etag_cache_size=etag_cache_size)
+        client.client.base_url = base_url
+        try:
+            first = await client.GET(CARD_ENDPOINT)
+            second = await client.GET(CARD_ENDPOINT)
+            return first, second, client.not_modified
+        finally:
+            await client.close()
+
+    return asyncio.run(read())
+
+
+def test_repeat_get_returns_cached_body_on_304(base_url):
+    first, second, not_modified = read_twice(base_url, "test-token-cached", 256)
+
+    assert first == CARD
+    # The 304 carries no body, so the body parsed from the first response is returned again
+    assert second is first
+    assert not_modified == 1
+
+
+def test_repeat_get_without_validator_cache_downloads_again(base_url):
+    first, second, not_modified = read_twice(base_url, "test-token-uncached", 0)
+
+    assert first == second == CARD
+    assert second is not first
+    assert not_modified == 0
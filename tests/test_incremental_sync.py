@@ -0,0 +1,60 @@
+"""
+Incremental runs: only boards with new actions since the checkpoint are rescanned.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from sync_scenario import TRIGGER_LABEL
+
+
+@pytest.fixture
+def incremental(scenario, monkeypatch):
+    monkeypatch.setenv("SYNC_MODE", "incremental")
+    # The first run has no checkpoint yet, so it scans everything and sets one
+    scenario.run()
+    return scenario
+
+
+def now() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def add_labelled_card(scenario, number: int, name: str, **kwargs) -> str:
+    """Create a labelled card on a project board, with the action an incremental run looks for."""
+    list_id = scenario.doing_lists[number]
+    card_id = scenario.trello.add_card(list_id, name, [scenario.trigger_labels[number]], **kwargs)
+    scenario.cards[name] = card_id
+    scenario.trello.add_action("createCard", scenario.trello.lists[list_id]["idBoard"], card_id, now())
+    return scenario.trello.lists[list_id]["idBoard"]
+
+
+def test_only_boards_with_new_actions_are_rescanned(incremental):
+    checkpoint = incremental.run().mapping["last_checkpoint"]
+    board_id = add_labelled_card(incremental, 1, "P1-New")
+
+    sync = incremental.run()
+    assert "P1-New" in incremental.weekly_cards()
+    assert sync.stats["pulled"] == 1
+    scanned = {params["idBoards"] for _, path, params in incremental.trello.calls if path == "/search"}
+    assert scanned == {board_id}
+    assert not any(path.endswith("/cards") and path.startswith("/boards/") for _, path, _ in incremental.trello.calls)
+    assert sync.mapping["last_checkpoint"] > checkpoint
+
+
+def test_failed_write_keeps_the_checkpoint(incremental):
+    checkpoint = incremental.run().mapping["last_checkpoint"]
+    add_labelled_card(incremental, 3, "P3-New", members=["member-1"])
+    incremental.trello.fail_card_creates = True
+
+    sync = incremental.run()
+    assert "P3-New" not in incremental.weekly_cards()
+    assert sync.mapping["last_checkpoint"] == checkpoint
+
+    # The action is still after the checkpoint, so the next run copies the card
+    incremental.trello.fail_card_creates = False
+    sync = incremental.run()
+    copy = incremental.weekly_cards()["P3-New"]
+    assert incremental.trello.label_names(copy) == ["Project 3", TRIGGER_LABEL]
+    assert sync.mapping["last_checkpoint"] > checkpoint
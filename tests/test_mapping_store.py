@@ -0,0 +1,50 @@
+"""
+Sharing one SQLite mapping store between the cron sync and the webhook server.
+"""
+
+from weekly_sync.mapping_store import SQLiteMappingStore
+
+
+def test_save_keeps_metadata_another_process_saved_since(tmp_path):
+    path = str(tmp_path / "mappings.db")
+
+    cron = SQLiteMappingStore(path)
+    cron.metadata["last_checkpoint"] = "T1"
+    cron.save()
+
+    webhook = SQLiteMappingStore(path)
+    assert webhook.metadata["last_checkpoint"] == "T1"
+
+    cron.metadata["last_checkpoint"] = "T2"
+    cron.save()
+
+    # The webhook only changed last_updated, so that is all it writes
+    webhook.metadata["last_updated"] = "webhook save"
+    webhook.save()
+
+    reopened = SQLiteMappingStore(path)
+    assert reopened.metadata["last_checkpoint"] == "T2"
+    assert reopened.metadata["last_updated"] == "webhook save"
+    for store in (cron, webhook, reopened):
+        store.close()
+
+
+def test_save_writes_each_change_once(tmp_path):
+    path = str(tmp_path / "mappings.db")
+    store = SQLiteMappingStore(path)
+    store.metadata["last_checkpoint"] = "T1"
+    store.save()
+
+    other = SQLiteMappingStore(path)
+    other.metadata["last_checkpoint"] = "T2"
+    other.save()
+
+    # Nothing changed here since the last save, so T2 stays
+    store.save()
+    assert SQLiteMappingStore(path).metadata["last_checkpoint"] == "T2"
+
+    store.metadata["last_checkpoint"] = "T3"
+    store.save()
+    assert SQLiteMappingStore(path).metadata["last_checkpoint"] == "T3"
+    store.close()
+    other.close()
@@ -0,0 +1,53 @@
+"""
+Webhook deliveries applied to the fake Trello through the weekly sync.
+"""
+
+import asyncio
+
+from server.webhook import WeeklySyncWebhook
+
+
+def action(scenario, action_id: str, action_type: str, board_id: str, card_id: str) -> dict:
+    """An action by the member behind the sync's token, who also edits the boards by hand."""
+    return {
+        "id": action_id,
+        "type": action_type,
+        "idMemberCreator": scenario.trello.member_id,
+        "data": {"board": {"id": board_id}, "card": {"id": card_id}},
+    }
+
+
+def deliver(scenario, *actions: dict) -> list[bool]:
+    """Start a webhook receiver, deliver the actions and wait until the workers are done."""
+    async def run():
+        webhook = WeeklySyncWebhook(scenario.make_sync(), "secret", "https://example.com/webhook", save_delay=0)
+        await webhook.start()
+        try:
+            accepted = [webhook.enqueue(item) for item in actions]
+            await asyncio.gather(*(queue.join() for queue in webhook.queues))
+            return accepted
+        finally:
+            await webhook.stop()
+
+    return asyncio.run(run())
+
+
+def test_owner_label_change_is_synced(scenario):
+    scenario.run()
+    card = scenario.trello.cards[scenario.cards["P0-C2"]]
+    card["idLabels"].append(scenario.trigger_labels[0])
+
+    accepted = deliver(scenario, action(scenario, "action-1", "addLabelToCard", card["idBoard"], card["id"]))
+
+    assert accepted == [True]
+    assert "P0-C2" in scenario.weekly_cards()
+
+
+def test_echo_of_the_syncs_own_write_plans_nothing(scenario):
+    scenario.run()
+    copy = scenario.weekly_cards()["P0-C0"]
+    scenario.trello.calls.clear()
+
+    deliver(scenario, action(scenario, "action-2", "createCard", scenario.weekly, copy["id"]))
+
+    assert scenario.trello.writes() == []
@@ -0,0 +1,178 @@
+"""
+Whole weekly sync runs against the in-memory fake Trello.
+
+Each test builds a few project boards and the Weekly board, runs the sync
+once or more, changes cards between runs and checks what ended up on the
+Weekly board, which comments were left and the order writes went out in.
+"""
+
+from sync_scenario import TRIGGER_LABEL
+
+LABELLED = {"P0-C0", "P0-C1", "P1-C0", "P1-C1", "P3-C0", "P3-C1"}
+
+
+def test_first_run_copies_labelled_cards(scenario):
+    sync = scenario.run()
+
+    weekly = scenario.weekly_cards()
+    assert set(weekly) == LABELLED
+    assert all(card["idList"] == scenario.this_week for card in weekly.values())
+    assert sync.stats == {"pulled": 6, "synced": 0, "removed": 0, "errors": 0}
+
+    copy = weekly["P0-C0"]
+    assert scenario.trello.label_names(copy) == ["Project 0", TRIGGER_LABEL]
+    assert copy["idMembers"] == ["member-1"]
+    assert copy["desc"].startswith("**Original Card:** https://trello.com/c/")
+    assert copy["desc"].endswith("Details of P0-C0")
+    assert any("Weekly Milestone board" in text for text in scenario.comments_on("P0-C0"))
+
+    weekly_labels = {
+        label["name"]: label["color"]
+        for label in scenario.trello.labels.values() if label["idBoard"] == scenario.weekly
+    }
+    assert weekly_labels[TRIGGER_LABEL] == "orange"
+    assert set(weekly_labels) == {TRIGGER_LABEL, "Project 0", "Project 1", "Project 3"}
+
+
+def test_runs_converge_and_reconcile_changes(scenario):
+    scenario.run()
+
+    # Nothing changed, so nothing is written
+    sync = scenario.run()
+    assert scenario.trello.writes() == []
+    assert sync.stats == {"pulled": 0, "synced": 0, "removed": 0, "errors": 0}
+
+    scenario.remove_trigger_label("P0-C0")
+    scenario.trello.cards[scenario.cards["P1-C1"]]["closed"] = True
+    del scenario.trello.cards[scenario.cards["P3-C0"]]
+    scenario.weekly_cards()["P3-C1"]["idList"] = scenario.completed
+    scenario.trello.add_card(scenario.this_week, "Added by hand")
+    scenario.cards["P0-New"] = scenario.trello.add_card(
+        scenario.doing_lists[0], "P0-New", [scenario.trigger_labels[0]]
+    )
+
+    sync = scenario.run()
+    weekly = scenario.weekly_cards()
+    assert set(weekly) == {"P0-C1", "P1-C0", "P1-C1", "P3-C1", "P0-New"}
+    # Archived original: its copy is completed, not removed
+    assert weekly["P1-C1"]["idList"] == scenario.completed
+    # Completed on the Weekly board: the original is told and the copy stays
+    assert weekly["P3-C1"]["idList"] == scenario.completed
+    assert any("Marked as completed" in text for text in scenario.comments_on("P3-C1"))
+    assert any("label removed from original card" in text for text in scenario.comments_on("P0-C0"))
+    # One move, one completion comment
+    assert sync.stats == {"pulled": 1, "synced": 2, "removed": 3, "errors": 0}
+    assert len(sync.mappings) == 5
+
+    # The next run only repeats the completion comment, which is posted every run
+    # while the original stays open
+    scenario.run()
+    assert scenario.trello.writes() == [("POST", f"/cards/{scenario.cards['P3-C1']}/actions/comments")]
+
+
+def test_writes_go_out_in_waves(scenario):
+    scenario.run()
+
+    new_board = scenario.trello.add_board("Project 4")
+    new_label = scenario.trello.add_label(new_board, TRIGGER_LABEL)
+    scenario.trello.add_card(scenario.trello.add_list(new_board, "Doing"), "P4-C0", [new_label])
+    scenario.trello.cards[scenario.cards["P1-C0"]]["closed"] = True
+    scenario.remove_trigger_label("P3-C0")
+
+    scenario.run()
+    writes = scenario.trello.writes()
+
+    def positions(method: str, path_prefix: str) -> list[int]:
+        return [i for i, (m, path) in enumerate(writes) if m == method and path.startswith(path_prefix)]
+
+    label_creates = positions("POST", "/labels")
+    card_creates = [i for i, write in enumerate(writes) if write == ("POST", "/cards")]
+    moves = positions("PUT", "/cards/")
+    deletes = positions("DELETE", "/cards/")
+    assert label_creates and card_creates and moves and deletes
+    # Labels, then copies, then moves, then removals
+    assert max(label_creates) < min(card_creates)
+    assert max(card_creates) < min(moves)
+    assert max(moves) < min(deletes)
+
+
+def test_label_removal_wins_over_move_to_completed(scenario):
+    scenario.run()
+    weekly_id = scenario.weekly_cards()["P0-C0"]["id"]
+
+    # Archived and unlabelled at once: the copy is removed, not completed first
+    scenario.trello.cards[scenario.cards["P0-C0"]]["closed"] = True
+    scenario.remove_trigger_label("P0-C0")
+
+    sync = scenario.run()
+    assert "P0-C0" not in scenario.weekly_cards()
+    assert ("DELETE", f"/cards/{weekly_id}") in scenario.trello.writes()
+    assert not any(method == "PUT" for method, _ in scenario.trello.writes())
+    assert sync.stats["removed"] == 1 and sync.stats["synced"] == 0
+
+
+def test_dry_run_plans_without_writing(scenario, caplog):
+    scenario.run()
+    with open(scenario.mapping_path) as f:
+        mapping_before = f.read()
+
+    scenario.remove_trigger_label("P0-C0")
+    scenario.trello.cards[scenario.cards["P1-C1"]]["closed"] = True
+
+    with caplog.at_level("INFO", logger="weekly_milestone_sync"):
+        scenario.run(dry_run=True)
+    assert scenario.trello.writes() == []
+    with open(scenario.mapping_path) as f:
+        assert f.read() == mapping_before
+    assert "DRY RUN: 2 planned write(s), nothing was changed" in caplog.text
+    assert "Move 'P1-C1' to Completed" in caplog.text
+    assert "Delete 'P0-C0'" in caplog.text
+
+    # The real run makes exactly the planned changes
+    scenario.run()
+    assert "P0-C0" not in scenario.weekly_cards()
+    assert scenario.weekly_cards()["P1-C1"]["idList"] == scenario.completed
+
+
+def test_unreadable_original_is_not_treated_as_deleted(scenario, monkeypatch):
+    monkeypatch.setenv("TRELLO_MAX_RETRIES", "0")
+    scenario.run()
+    scenario.remove_trigger_label("P0-C0")
+    scenario.trello.unreadable_cards.add(scenario.cards["P0-C0"])
+
+    # The original can't be read, so the pair is left alone
+    sync = scenario.run()
+    assert "P0-C0" in scenario.weekly_cards()
+    assert sync.find_mapping(original_card_id=scenario.cards["P0-C0"])
+    assert not any(method == "DELETE" for method, _ in scenario.trello.writes())
+    assert sync.stats["errors"] > 0
+
+    # Once it can be read again the label removal is applied
+    scenario.trello.unreadable_cards.clear()
+    sync = scenario.run()
+    assert "P0-C0" not in scenario.weekly_cards()
+    assert sync.stats["removed"] == 1
+
+
+def test_card_create_rejected_for_members_is_retried_without_them(scenario):
+    scenario.trello.outside_members.add("member-1")
+
+    sync = scenario.run()
+    card_creates = [call for call in scenario.trello.calls if call[:2] == ("POST", "/cards")]
+    # The three cards with a member are each posted twice, the second time without members
+    assert len(card_creates) == 9
+    assert sum("idMembers" in params for _, _, params in card_creates) == 3
+    copy = scenario.weekly_cards()["P0-C0"]
+    assert ("POST", f"/cards/{copy['id']}/idMembers") in scenario.trello.writes()
+    assert copy["idMembers"] == ["member-1"]
+    assert sync.stats["pulled"] == 6
+
+
+def test_failed_card_create_is_not_retried(scenario):
+    scenario.trello.fail_card_creates = True
+
+    sync = scenario.run()
+    # A 500 may have created the card anyway, so each card is posted once
+    assert scenario.trello.writes().count(("POST", "/cards")) == 6
+    assert scenario.weekly_cards() == {}
+    assert sync.stats["pulled"] == 0 and len(sync.mappings) == 0
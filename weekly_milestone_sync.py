@@ -4,29 +4,68 @@ Weekly Milestone Board Sync Script
 Automatically syncs cards labeled "This Week" from project boards to a centralized Weekly Milestone board.
 """
 
+import argparse
+import asyncio
 import json
 import os
 import sys
-import requests
-from datetime import datetime
-from typing import Dict, List, Optional, Set
+import httpx
+from urllib.parse import quote
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Dict, Iterable, List, Optional, Set, Tuple, TypeVar
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
-# Set up logging
-log_dir = os.path.join(os.path.dirname(__file__), 'logs')
-os.makedirs(log_dir, exist_ok=True)
+from server.utils.metrics import EndpointStats, MetricsRegistry
+from server.utils.retry import RetryPolicy
+from server.utils.trello_api import TrelloClient
+from weekly_sync.board_scan import SCAN_CARD_FIELDS, BoardScanner
+from weekly_sync.card_snapshot import CardSnapshot
+from weekly_sync.mapping_store import open_mapping_store
+from weekly_sync.sharding import partition_boards
+from weekly_sync.sync_plan import CommentOnCard, CopyCard, MoveCard, RemoveCard, SyncPlan
 
-log_file = os.path.join(log_dir, f'weekly_sync_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# Trello's /batch endpoint accepts at most 10 GET routes per call
+BATCH_LIMIT = 10
+
+# Card fields each phase reads (SCAN_CARD_FIELDS for project boards); everything else
+# (badges, full descriptions, ...) stays on the server
+MAPPED_CARD_FIELDS = 'id,name,idList,labels,closed'
+COPY_CARD_FIELDS = 'desc'
+WEEKLY_CARD_FIELDS = 'id,name,idList,labels'
+
+# Board actions that can change what belongs on the Weekly board (incremental mode)
+INCREMENTAL_ACTION_TYPES = (
+    'addLabelToCard,removeLabelFromCard,updateCard,deleteCard,'
+    'createCard,copyCard,moveCardToBoard,convertToCardFromCheckItem'
+)
+# Of those, the ones that put a card on a board, possibly with the trigger label already on it
+NEW_CARD_ACTION_TYPES = ('createCard', 'copyCard', 'moveCardToBoard', 'convertToCardFromCheckItem')
+ACTIONS_LIMIT = 1000
+
+T = TypeVar('T')
+
+
+def build_client(api_key: str, api_token: str, settings: Dict, metrics: MetricsRegistry = None) -> TrelloClient:
+    """Create a Trello client from the sync's HTTP settings"""
+    return TrelloClient(
+        api_key,
+        api_token,
+        metrics=metrics,
+        # POSTs are never retried: a retried card create can leave a duplicate on the Weekly board
+        retry_policy=RetryPolicy(max_retries=settings['max_retries']),
+        http2=settings['http2'],
+        max_connections=settings['pool_size'],
+        max_keepalive_connections=settings['pool_size'],
+        # Each card is read once per run, so remembered ETags would never be revalidated
+        # and would only keep every response body in memory until the process exits
+        etag_cache_size=0,
+        timeout=settings['timeout'] or None
+    )
+
 
 class TrelloWeeklySync:
     def __init__(self, config_path='weekly_config.json', mapping_path='weekly_sync_mapping.json'):
@@ -34,14 +73,15 @@ class TrelloWeeklySync:
         self.config_path = config_path
         self.mapping_path = mapping_path
         self.config = self.load_config()
-        self.mapping = self.load_mapping()
+        self.mappings = self.load_mapping()
+        # Run metadata stored alongside the mappings (last_updated, ...)
+        self.mapping = self.mappings.metadata
         
         # Get API credentials from config or environment
         self.api_key = os.getenv('TRELLO_API_KEY', self.config.get('api_key'))
         self.api_token = os.getenv('TRELLO_API_TOKEN', self.config.get('api_token'))
         self.weekly_board_id = os.getenv('WEEKLY_BOARD_ID', self.config.get('weekly_board_id'))
         
-        self.base_url = 'https://api.trello.com/1'
         self.stats = {
             'pulled': 0,
             'synced': 0,
@@ -49,13 +89,81 @@ class TrelloWeeklySync:
             'errors': 0
         }
         
-        # Auto-load lists if not configured (for GitHub Actions)
+        # Per-run snapshot of fetched cards (None = card no longer exists)
+        self.card_cache: Dict[str, Optional[CardSnapshot]] = {}
+        # Per-run registry of Weekly board label IDs by name (None = not loaded yet)
+        self.weekly_labels: Optional[Dict[str, str]] = None
+        self.weekly_label_count = 0
+        self._weekly_label_lock = asyncio.Lock()
+        
+        # 'search' fetches only labelled cards; 'board' downloads every card on every board
+        self.discovery_mode = os.getenv('DISCOVERY_MODE', self.config.get('discovery_mode', 'search'))
+        # Finds the labelled cards on project boards (caches each board's trigger label IDs per run)
+        self.scanner = BoardScanner(self.api_request, self.config['trigger_label'], self.discovery_mode)
+        
+        # 'incremental' only processes cards with board actions since the last run, with a
+        # periodic full scan; 'full' rescans everything every run
+        self.sync_mode = os.getenv('SYNC_MODE', self.config.get('sync_mode', 'full'))
+        self.full_scan_interval = timedelta(
+            hours=float(os.getenv('FULL_SCAN_INTERVAL_HOURS', self.config.get('full_scan_interval_hours', 24)))
+        )
+        
+        # Plan the run and log the plan without making any changes
+        self.dry_run = False
+        
+        # Number of requests (boards scanned, batches fetched, ...) in flight at once
+        self.scan_concurrency = max(1, int(os.getenv('SCAN_CONCURRENCY', self.config.get('scan_concurrency', 8))))
+        
+        # Board scans can be split across worker processes, each with its own client and rate
+        # budget ('organization' keeps workspaces together, 'hash' spreads boards by ID); this
+        # process still owns the mappings and makes every write
+        self.shards = max(1, int(os.getenv('SYNC_SHARDS', self.config.get('shards', 1))))
+        self.shard_by = os.getenv('SHARD_BY', self.config.get('shard_by', 'organization'))
+        # Optional extra tokens, one per shard in turn; shards sharing a token split its budget
+        shard_tokens = os.getenv('TRELLO_SHARD_TOKENS', self.config.get('shard_tokens', []))
+        if isinstance(shard_tokens, str):
+            shard_tokens = shard_tokens.split(',')
+        self.shard_tokens = [token.strip() for token in shard_tokens if token.strip()]
+        
+        # HTTP settings of the Trello client: keep-alive pool sized for the scan concurrency,
+        # optional HTTP/2, retries of idempotent calls, and a timeout long enough for search,
+        # /batch and whole-board reads (0 = no timeout)
+        self.client_settings = {
+            'pool_size': int(os.getenv('HTTP_POOL_SIZE', self.config.get('http_pool_size', max(10, self.scan_concurrency)))),
+            'http2': str(os.getenv('TRELLO_HTTP2', self.config.get('http2', False))).lower() == 'true',
+            'max_retries': int(os.getenv('TRELLO_MAX_RETRIES', self.config.get('max_retries', 3))),
+            'timeout': float(os.getenv('TRELLO_TIMEOUT', self.config.get('http_timeout', 60)))
+        }
+        
+        # The MCP server's client: one keep-alive pool, retries and the shared rate limiter
+        self.client = self.create_client()
+    
+    def create_client(self) -> TrelloClient:
+        """Create a Trello client with the sync's HTTP settings"""
+        return build_client(self.api_key, self.api_token, self.client_settings)
+    
+    async def close(self):
+        """Close the HTTP connection pool"""
+        await self.client.close()
+    
+    async def load_lists(self):
+        """Auto-load lists if not configured (for GitHub Actions)"""
         if not self.config.get('lists'):
-            self.config['lists'] = self.get_board_lists()
+            self.config['lists'] = await self.get_board_lists()
+    
+    async def gather_limited(self, awaitables: Iterable[Awaitable[T]]) -> List[T]:
+        """Await all, at most scan_concurrency at a time, returning results in order"""
+        semaphore = asyncio.Semaphore(self.scan_concurrency)
+        
+        async def limited(awaitable: Awaitable[T]) -> T:
+            async with semaphore:
+                return await awaitable
+        
+        return await asyncio.gather(*(limited(awaitable) for awaitable in awaitables))
     
-    def get_board_lists(self) -> Dict:
+    async def get_board_lists(self) -> Dict:
         """Get board lists and map them by name"""
-        lists_response = self.api_request('GET', f'boards/{self.weekly_board_id}/lists')
+        lists_response = await self.api_request('GET', f'boards/{self.weekly_board_id}/lists')
         if not lists_response:
             logger.warning("Could not get board lists, using first list as default")
             return {'this_week': None}
@@ -93,84 +201,107 @@ class TrelloWeeklySync:
             logger.error(f"Invalid JSON in config file: {e}")
             sys.exit(1)
     
-    def load_mapping(self) -> Dict:
-        """Load card mapping file"""
-        try:
-            with open(self.mapping_path, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return {'mappings': [], 'last_updated': None}
-        except json.JSONDecodeError:
-            logger.warning("Invalid mapping file, starting fresh")
-            return {'mappings': [], 'last_updated': None}
+    def load_mapping(self):
+        """Open the card mapping store (JSON file by default, or SQLite)"""
+        backend = os.getenv('MAPPING_BACKEND', self.config.get('mapping_backend', 'json'))
+        db_path = os.getenv('MAPPING_DB_PATH', self.config.get('mapping_db_path', 'weekly_sync_mapping.db'))
+        return open_mapping_store(backend, self.mapping_path, db_path)
     
     def save_mapping(self):
-        """Save card mapping to file"""
+        """Save card mapping (SQLite only writes metadata; mappings are saved as they change)"""
+        self.mapping['last_updated'] = datetime.now().isoformat()
+        self.mappings.save()
+        logger.info(f"Mapping saved with {len(self.mappings)} entries")
+    
+    async def save_mapping_async(self):
+        """Save card mapping from a worker thread, so the event loop isn't blocked by the file write"""
         self.mapping['last_updated'] = datetime.now().isoformat()
-        with open(self.mapping_path, 'w') as f:
-            json.dump(self.mapping, f, indent=2)
-        logger.info(f"Mapping saved with {len(self.mapping['mappings'])} entries")
+        # The snapshot is taken here, on the loop; only serializing and writing it happen in the thread
+        await asyncio.to_thread(self.mappings.prepare_save())
     
-    def api_request(self, method: str, endpoint: str, params: Dict = None, data: Dict = None) -> Optional[Dict]:
+    async def api_request(self, method: str, endpoint: str, params: Dict = None, data: Dict = None) -> Optional[Dict]:
         """Make API request to Trello"""
-        url = f"{self.base_url}/{endpoint}"
-        auth_params = {'key': self.api_key, 'token': self.api_token}
-        
-        if params:
-            auth_params.update(params)
+        return (await self.api_request_with_status(method, endpoint, params, data))[0]
+    
+    async def api_request_with_status(
+        self, method: str, endpoint: str, params: Dict = None, data: Dict = None
+    ) -> Tuple[Optional[Dict], Optional[int]]:
+        """Make API request to Trello, returning the body (None on failure) and the error status (None if no response)"""
+        if method not in ('GET', 'POST', 'PUT', 'DELETE'):
+            logger.error(f"Unsupported HTTP method: {method}")
+            return None, None
         
         try:
-            if method == 'GET':
-                response = requests.get(url, params=auth_params)
-            elif method == 'POST':
-                response = requests.post(url, params=auth_params, json=data)
-            elif method == 'PUT':
-                response = requests.put(url, params=auth_params, json=data)
-            elif method == 'DELETE':
-                response = requests.delete(url, params=auth_params)
-            else:
-                logger.error(f"Unsupported HTTP method: {method}")
-                return None
-            
-            response.raise_for_status()
-            return response.json() if response.text else {}
-        
-        except requests.exceptions.RequestException as e:
+            # Rate limiting, 429 re-queueing and retries of transient failures happen in the client
+            return await self.client.request(method, f'/{endpoint}', params=params, data=data), None
+        except httpx.HTTPStatusError as e:
             logger.error(f"API request failed: {e}")
             self.stats['errors'] += 1
-            return None
+            return None, e.response.status_code
+        except (httpx.HTTPError, ValueError) as e:
+            logger.error(f"API request failed: {e}")
+            self.stats['errors'] += 1
+            return None, None
     
-    def get_cards_with_label(self, board_id: str, label_name: str) -> List[Dict]:
-        """Get all cards on a board with a specific label"""
-        cards = self.api_request('GET', f'boards/{board_id}/cards', {'fields': 'all'})
-        if not cards:
-            return []
-        
-        filtered_cards = []
-        for card in cards:
-            for label in card.get('labels', []):
-                if label.get('name') == label_name:
-                    filtered_cards.append(card)
-                    break
+    async def get_card(self, card_id: str) -> Optional[CardSnapshot]:
+        """Get card details (fetched at most once per run; None if deleted or unreadable)"""
+        if card_id not in self.card_cache:
+            card, status = await self.api_request_with_status('GET', f'cards/{card_id}', {'fields': MAPPED_CARD_FIELDS})
+            if card:
+                self.card_cache[card_id] = CardSnapshot.from_api(card)
+            elif status == 404:
+                # Only a 404 means the card is gone; other failures stay uncached so reconcile skips the card
+                self.card_cache[card_id] = None
+            else:
+                return None
+        return self.card_cache[card_id]
+    
+    async def batch_get_cards(self, card_ids: List[str]) -> Dict[str, Optional[CardSnapshot]]:
+        """Get up to BATCH_LIMIT cards in one /batch call"""
+        # Commas separate the batch routes, so the ones inside each route's field list are escaped
+        fields = quote(MAPPED_CARD_FIELDS, safe='')
+        urls = ','.join(f'/cards/{card_id}?fields={fields}' for card_id in card_ids)
+        response = await self.api_request('GET', 'batch', {'urls': urls})
+        if not isinstance(response, list):
+            return {}
+        
+        cards = {}
+        for card_id, result in zip(card_ids, response):
+            if '200' in result:
+                cards[card_id] = CardSnapshot.from_api(result['200'])
+            elif '404' in result or result.get('statusCode') == 404:
+                # Deleted card; other failures are left out so get_card retries them
+                cards[card_id] = None
+        return cards
+    
+    async def prefetch_cards(self, card_ids: List[str]):
+        """Load cards into the per-run cache with /batch calls, several batches at a time"""
+        missing = [card_id for card_id in dict.fromkeys(card_ids) if card_id not in self.card_cache]
+        chunks = [missing[i:i + BATCH_LIMIT] for i in range(0, len(missing), BATCH_LIMIT)]
+        if not chunks:
+            return
         
-        return filtered_cards
+        for cards in await self.gather_limited(self.batch_get_cards(chunk) for chunk in chunks):
+            self.card_cache.update(cards)
+        logger.info(f"Prefetched {len(missing)} card(s) in {len(chunks)} batch call(s)")
     
-    def get_card(self, card_id: str) -> Optional[Dict]:
-        """Get card details"""
-        return self.api_request('GET', f'cards/{card_id}', {'fields': 'all'})
+    async def prefetch_mapped_cards(self, mappings: List[Dict]):
+        """Load both sides of the given mappings into the per-run cache"""
+        card_ids = []
+        for mapping in mappings:
+            card_ids.append(mapping['original_card_id'])
+            card_ids.append(mapping['weekly_card_id'])
+        await self.prefetch_cards(card_ids)
+        # Cards a batch couldn't return are fetched one at a time
+        await self.gather_limited(self.get_card(card_id) for card_id in card_ids if card_id not in self.card_cache)
     
     def find_mapping(self, original_card_id: str = None, weekly_card_id: str = None) -> Optional[Dict]:
         """Find mapping entry"""
-        for mapping in self.mapping['mappings']:
-            if original_card_id and mapping['original_card_id'] == original_card_id:
-                return mapping
-            if weekly_card_id and mapping['weekly_card_id'] == weekly_card_id:
-                return mapping
-        return None
+        return self.mappings.get(original_card_id=original_card_id, weekly_card_id=weekly_card_id)
     
     def add_mapping(self, original_card_id: str, weekly_card_id: str, original_board_id: str, original_list_id: str):
         """Add new mapping entry"""
-        self.mapping['mappings'].append({
+        self.mappings.add({
             'original_card_id': original_card_id,
             'weekly_card_id': weekly_card_id,
             'original_board_id': original_board_id,
@@ -180,172 +311,223 @@ class TrelloWeeklySync:
     
     def remove_mapping(self, original_card_id: str = None, weekly_card_id: str = None):
         """Remove mapping entry"""
-        self.mapping['mappings'] = [
-            m for m in self.mapping['mappings']
-            if not ((original_card_id and m['original_card_id'] == original_card_id) or
-                   (weekly_card_id and m['weekly_card_id'] == weekly_card_id))
-        ]
+        self.mappings.remove(original_card_id=original_card_id, weekly_card_id=weekly_card_id)
     
-    def copy_card_to_weekly(self, original_card: Dict, project_board: Dict):
-        """Copy a card to the Weekly Milestone board"""
+    async def copy_card_to_weekly(self, original_card: CardSnapshot, project_board: Dict) -> Optional[Dict]:
+        """Copy a card to the Weekly Milestone board, returning the new card"""
         # Check if already copied
-        if self.find_mapping(original_card_id=original_card['id']):
-            logger.info(f"Card already on Weekly board: {original_card['name']}")
-            return
+        if self.find_mapping(original_card_id=original_card.id):
+            logger.info(f"Card already on Weekly board: {original_card.name}")
+            return None
         
         # Prepare card description with link to original
-        original_url = original_card.get('shortUrl', original_card.get('url', ''))
-        new_description = f"**Original Card:** {original_url}\n\n{original_card.get('desc', '')}"
+        original_url = original_card.shortUrl
+        # The scan leaves descriptions out; only cards actually being copied need one
+        details = await self.api_request('GET', f"cards/{original_card.id}", {'fields': COPY_CARD_FIELDS}) or {}
+        new_description = f"**Original Card:** {original_url}\n\n{details.get('desc', '')}"
         
-        # Create new card on Weekly board
+        # The "This Week" label lets the card be removed from either location
+        this_week_label_id = await self.get_or_create_weekly_label(self.config['trigger_label'], color='orange')
+        
+        # Create new card on Weekly board, with the labels and members set in the same call
         new_card_params = {
             'idList': self.config['lists']['this_week'],
-            'name': original_card['name'],
+            'name': original_card.name,
             'desc': new_description,
             'pos': 'top'
         }
+        label_ids = [label_id for label_id in (project_board['weekly_label_id'], this_week_label_id) if label_id]
+        if label_ids:
+            new_card_params['idLabels'] = ','.join(label_ids)
+        if original_card.idMembers:
+            new_card_params['idMembers'] = ','.join(original_card.idMembers)
         
         # Copy due date if exists
-        if original_card.get('due'):
-            new_card_params['due'] = original_card['due']
-        
-        new_card = self.api_request('POST', 'cards', params=new_card_params)
+        if original_card.due:
+            new_card_params['due'] = original_card.due
+        
+        new_card, status = await self.api_request_with_status('POST', 'cards', params=new_card_params)
+        members_to_add = []
+        if not new_card and status == 400 and original_card.idMembers:
+            # Trello rejects the whole card (400) if any member isn't on the Weekly board;
+            # create it without them and add members one by one. Any other failure (5xx,
+            # timeout) may have created the card anyway, so it isn't posted twice
+            logger.info(f"Retrying without inline members: {original_card.name}")
+            del new_card_params['idMembers']
+            new_card = await self.api_request('POST', 'cards', params=new_card_params)
+            members_to_add = original_card.idMembers
         
         if not new_card:
-            logger.error(f"Failed to create card: {original_card['name']}")
-            return
-        
-        logger.info(f"✓ Created card on Weekly board: {original_card['name']}")
-        
-        # Add project label
-        label_id = project_board['weekly_label_id']
-        self.api_request('POST', f"cards/{new_card['id']}/idLabels", params={'value': label_id})
-        
-        # Add "This Week" label to Weekly card so it can be removed from either location
-        self.api_request('POST', f"cards/{new_card['id']}/labels", params={'color': 'orange', 'name': 'This Week'})
+            logger.error(f"Failed to create card: {original_card.name}")
+            return None
         
-        # Copy members
-        for member_id in original_card.get('idMembers', []):
-            self.api_request('POST', f"cards/{new_card['id']}/idMembers", params={'value': member_id})
+        logger.info(f"✓ Created card on Weekly board: {original_card.name}")
         
-        # Add comment to original card
         board_url = self.config.get('weekly_board_url', f"https://trello.com/b/{self.weekly_board_id}")
         comment = f"📅 This card has been added to the [Weekly Milestone board]({board_url})"
-        self.api_request('POST', f"cards/{original_card['id']}/actions/comments", params={'text': comment})
+        
+        # The remaining calls don't depend on each other, so they go out together
+        follow_ups = [
+            # Add comment to original card
+            self.api_request('POST', f"cards/{original_card.id}/actions/comments", params={'text': comment})
+        ]
+        follow_ups.extend(
+            self.api_request('POST', f"cards/{new_card['id']}/idMembers", params={'value': member_id})
+            for member_id in members_to_add
+        )
+        if not this_week_label_id:
+            # Label lookup failed; fall back to creating it on the card by name
+            follow_ups.append(self.api_request(
+                'POST', f"cards/{new_card['id']}/labels",
+                params={'color': 'orange', 'name': self.config['trigger_label']}
+            ))
+        await asyncio.gather(*follow_ups)
         
         # Store mapping
         self.add_mapping(
-            original_card['id'],
+            original_card.id,
             new_card['id'],
             project_board['id'],
-            original_card['idList']
+            original_card.idList
         )
         
         self.stats['pulled'] += 1
+        return new_card
+    
+    async def get_weekly_cards(self) -> Optional[List[CardSnapshot]]:
+        """Get every open card on the Weekly board"""
+        cards = await self.api_request('GET', f'boards/{self.weekly_board_id}/cards', {'fields': WEEKLY_CARD_FIELDS})
+        return None if cards is None else [CardSnapshot.from_api(card) for card in cards]
     
-    def sync_card_status(self, mapping: Dict):
-        """Sync status between original and weekly cards"""
-        original_card = self.get_card(mapping['original_card_id'])
-        weekly_card = self.get_card(mapping['weekly_card_id'])
+    def reconcile(
+        self,
+        scan_results: List[Tuple[Dict, List[CardSnapshot]]],
+        mappings: List[Dict],
+        weekly_cards: Optional[List[CardSnapshot]] = None
+    ) -> SyncPlan:
+        """Decide every write in one pass over cards that were already read (nothing is fetched or changed here)"""
+        trigger_label = self.config['trigger_label']
+        plan = SyncPlan()
+        
+        # Mapped cards: both sides are looked up by ID in the card cache, which holds the
+        # scanned cards, the Weekly board cards and whatever else the mappings needed
+        for mapping in mappings:
+            unread = [
+                card_id for card_id in (mapping['original_card_id'], mapping['weekly_card_id'])
+                if card_id not in self.card_cache
+            ]
+            if unread:
+                # A card that couldn't be read isn't known to be deleted; leave the pair for the next run
+                logger.warning(f"Skipping mapping: card(s) {', '.join(unread)} couldn't be read")
+                continue
+            self.reconcile_mapping(
+                plan,
+                self.card_cache.get(mapping['original_card_id']),
+                self.card_cache.get(mapping['weekly_card_id']),
+                mapping
+            )
+        
+        # Labelled project cards without a mapping are copied
+        boards_with_cards = 0
+        planned_card_ids = set()
+        for board, cards in scan_results:
+            logger.info(f"Scanned: {board['name']}")
+            if not cards:
+                continue
+            
+            boards_with_cards += 1
+            logger.info(f"  ✓ Found {len(cards)} card(s) with '{trigger_label}' label")
+            for card in cards:
+                if self.find_mapping(original_card_id=card.id):
+                    logger.info(f"Card already on Weekly board: {card.name}")
+                    continue
+                if card.id not in planned_card_ids:
+                    planned_card_ids.add(card.id)
+                    # An archived original still gets copied, then completed like any mapped card would be
+                    plan.copies.append(CopyCard(card, board['id'], board['name'], complete=card.closed))
+        
+        if scan_results:
+            logger.info(f"\nScan complete: {boards_with_cards} boards had cards with 'This Week' label")
+        
+        # Labels the copies need, in the order the copies first need them
+        for copy in plan.copies:
+            for name in (copy.board_name, trigger_label):
+                if name not in plan.labels and not (self.weekly_labels and name in self.weekly_labels):
+                    plan.labels.append(name)
+        
+        # Weekly board cards without a mapping are orphans unless they carry the label
+        if weekly_cards:
+            mapped_card_ids = self.mappings.weekly_card_ids()
+            for card in weekly_cards:
+                if card.id not in mapped_card_ids and not card.has_label(trigger_label):
+                    plan.removals.append(RemoveCard(card.id, card.name, "orphaned card without 'This Week' label"))
+        
+        return plan
+    
+    def reconcile_mapping(
+        self,
+        plan: SyncPlan,
+        original_card: Optional[CardSnapshot],
+        weekly_card: Optional[CardSnapshot],
+        mapping: Dict
+    ):
+        """Plan the writes for one mapped pair of cards (None = card deleted)"""
+        if not original_card:
+            # Original card was deleted
+            plan.removals.append(RemoveCard(
+                weekly_card.id if weekly_card else None,
+                weekly_card.name if weekly_card else mapping['weekly_card_id'],
+                'original card deleted',
+                mapping
+            ))
+            return
         
-        if not original_card or not weekly_card:
-            logger.warning(f"Card not found for mapping: {mapping}")
+        if not weekly_card:
+            # Weekly card was manually deleted
+            plan.removals.append(RemoveCard(
+                None,
+                original_card.name,
+                'Weekly card deleted manually',
+                mapping,
+                CommentOnCard(original_card.id, original_card.name, "🔄 Removed from Weekly Milestone board (card deleted)")
+            ))
             return
         
+        completed_list = self.config['lists']['completed']
+        
         # Check if weekly card moved to "Completed"
-        if weekly_card['idList'] == self.config['lists']['completed']:
+        if weekly_card.idList == completed_list and not original_card.closed:
             # Move original card to completed (if it has a completed-like list)
             # For now, just add a comment
-            if not original_card.get('closed', False):
-                comment = "✅ Marked as completed on Weekly Milestone board"
-                self.api_request('POST', f"cards/{original_card['id']}/actions/comments", params={'text': comment})
-                logger.info(f"Synced completion: {original_card['name']}")
-                self.stats['synced'] += 1
-        
-        # Check if original card is closed/archived
-        if original_card.get('closed', False):
-            # Move weekly card to completed
-            if weekly_card['idList'] != self.config['lists']['completed']:
-                self.api_request('PUT', f"cards/{weekly_card['id']}", params={'idList': self.config['lists']['completed']})
-                logger.info(f"Moved to completed (original closed): {weekly_card['name']}")
-                self.stats['synced'] += 1
-    
-    def cleanup_orphaned_cards(self):
-        """Remove cards from Weekly board that don't have 'This Week' label (not in mapping)"""
-        logger.info("Checking for orphaned cards on Weekly board...")
-        all_weekly_cards = self.api_request('GET', f'boards/{self.weekly_board_id}/cards')
-        
-        if not all_weekly_cards:
-            return
-        
-        # Get all mapped weekly card IDs
-        mapped_card_ids = {m['weekly_card_id'] for m in self.mapping['mappings']}
-        
-        orphans_removed = 0
-        for card in all_weekly_cards:
-            # Skip cards that are in the mapping (they're handled by cleanup_removed_labels)
-            if card['id'] in mapped_card_ids:
-                continue
-            
-            # Check if card has "This Week" label
-            has_this_week_label = any(label.get('name') == self.config['trigger_label'] for label in card.get('labels', []))
-            
-            if not has_this_week_label:
-                logger.info(f"Removing orphaned card without 'This Week' label: {card['name']}")
-                self.api_request('DELETE', f"cards/{card['id']}")
-                orphans_removed += 1
-                self.stats['removed'] += 1
-        
-        if orphans_removed > 0:
-            logger.info(f"Removed {orphans_removed} orphaned card(s)")
-    
-    def cleanup_removed_labels(self):
-        """Remove cards from Weekly board when 'This Week' label is removed"""
-        for mapping in self.mapping['mappings'][:]:  # Copy list to allow modification during iteration
-            original_card = self.get_card(mapping['original_card_id'])
-            weekly_card = self.get_card(mapping['weekly_card_id'])
-            
-            if not original_card:
-                # Original card was deleted
-                logger.info(f"Original card deleted, removing from Weekly board")
-                if weekly_card:
-                    self.api_request('DELETE', f"cards/{mapping['weekly_card_id']}")
-                self.remove_mapping(weekly_card_id=mapping['weekly_card_id'])
-                self.stats['removed'] += 1
-                continue
-            
-            if not weekly_card:
-                # Weekly card was manually deleted
-                logger.info(f"Weekly card deleted manually, cleaning up mapping")
-                comment = "🔄 Removed from Weekly Milestone board (card deleted)"
-                self.api_request('POST', f"cards/{original_card['id']}/actions/comments", params={'text': comment})
-                self.remove_mapping(weekly_card_id=mapping['weekly_card_id'])
-                self.stats['removed'] += 1
-                continue
-            
-            # Check if "This Week" label still exists on EITHER card
-            original_has_label = any(label.get('name') == self.config['trigger_label'] for label in original_card.get('labels', []))
-            weekly_has_label = any(label.get('name') == self.config['trigger_label'] for label in weekly_card.get('labels', []))
-            
-            # If label removed from either card, clean up
-            if not original_has_label or not weekly_has_label:
-                removed_from = "original card" if not original_has_label else "Weekly board"
-                logger.info(f"'This Week' label removed from {removed_from}: {original_card['name']}")
-                
-                # Delete from Weekly board
-                self.api_request('DELETE', f"cards/{mapping['weekly_card_id']}")
-                
-                # Add comment to original
-                comment = f"🔄 Removed from Weekly Milestone board (label removed from {removed_from})"
-                self.api_request('POST', f"cards/{original_card['id']}/actions/comments", params={'text': comment})
-                
-                # Remove mapping
-                self.remove_mapping(weekly_card_id=mapping['weekly_card_id'])
-                self.stats['removed'] += 1
-    
-    def get_all_boards(self) -> List[Dict]:
+            plan.comments.append(CommentOnCard(
+                original_card.id, original_card.name, "✅ Marked as completed on Weekly Milestone board"
+            ))
+        
+        # Check if "This Week" label still exists on EITHER card
+        original_has_label = original_card.has_label(self.config['trigger_label'])
+        weekly_has_label = weekly_card.has_label(self.config['trigger_label'])
+        
+        # If label removed from either card, clean up
+        if not original_has_label or not weekly_has_label:
+            removed_from = "original card" if not original_has_label else "Weekly board"
+            plan.removals.append(RemoveCard(
+                weekly_card.id,
+                weekly_card.name,
+                f"'This Week' label removed from {removed_from}",
+                mapping,
+                CommentOnCard(
+                    original_card.id,
+                    original_card.name,
+                    f"🔄 Removed from Weekly Milestone board (label removed from {removed_from})"
+                )
+            ))
+        elif original_card.closed and weekly_card.idList != completed_list:
+            # Original card is closed/archived (a card being deleted isn't worth moving)
+            plan.moves.append(MoveCard(weekly_card.id, weekly_card.name, completed_list))
+    
+    async def get_all_boards(self) -> List[Dict]:
         """Get all boards user has access to across all workspaces"""
-        boards = self.api_request('GET', 'members/me/boards', {'fields': 'name,id'})
+        boards = await self.api_request('GET', 'members/me/boards', {'fields': 'name,id,idOrganization'})
         if not boards:
             return []
         
@@ -353,94 +535,360 @@ class TrelloWeeklySync:
         filtered_boards = [b for b in boards if b['id'] != self.weekly_board_id]
         return filtered_boards
     
-    def get_or_create_project_label(self, board_name: str) -> str:
+    async def get_or_create_project_label(self, board_name: str) -> str:
         """Get or create label for a project board on Weekly board"""
-        # Check if label already exists
-        weekly_labels = self.api_request('GET', f'boards/{self.weekly_board_id}/labels')
-        if weekly_labels:
-            for label in weekly_labels:
-                if label.get('name') == board_name:
-                    return label['id']
-        
-        # Create new label (cycle through colors)
-        colors = ['blue', 'green', 'yellow', 'orange', 'red', 'purple', 'pink', 'lime', 'sky', 'black']
-        color_index = len(weekly_labels or []) % len(colors)
-        
-        new_label = self.api_request('POST', 'labels', params={
-            'name': board_name,
-            'color': colors[color_index],
-            'idBoard': self.weekly_board_id
-        })
-        
-        return new_label['id'] if new_label else None
+        return await self.get_or_create_weekly_label(board_name)
+    
+    async def read_weekly_labels(self):
+        """Fill the Weekly board label registry if it isn't loaded yet (call with the registry lock held)"""
+        if self.weekly_labels is not None:
+            return
+        weekly_labels = await self.api_request('GET', f'boards/{self.weekly_board_id}/labels', {'fields': 'name', 'limit': 1000})
+        if weekly_labels is not None:
+            # Keep the first label of each name, like a lookup by name would
+            self.weekly_labels = {}
+            for label in reversed(weekly_labels):
+                self.weekly_labels[label.get('name')] = label['id']
+            self.weekly_label_count = len(weekly_labels)
+    
+    async def load_weekly_labels(self):
+        """Read the Weekly board's labels into the per-run registry"""
+        async with self._weekly_label_lock:
+            await self.read_weekly_labels()
+    
+    async def get_or_create_weekly_label(self, name: str, color: str = None) -> Optional[str]:
+        """Get or create a Weekly board label by name (board labels are read once per run)"""
+        async with self._weekly_label_lock:
+            await self.read_weekly_labels()
+            
+            # Check if label already exists
+            if self.weekly_labels and name in self.weekly_labels:
+                return self.weekly_labels[name]
+            
+            # Create new label (cycle through colors)
+            if not color:
+                colors = ['blue', 'green', 'yellow', 'orange', 'red', 'purple', 'pink', 'lime', 'sky', 'black']
+                color = colors[self.weekly_label_count % len(colors)]
+            
+            new_label = await self.api_request('POST', 'labels', params={
+                'name': name,
+                'color': color,
+                'idBoard': self.weekly_board_id
+            })
+            if not new_label:
+                return None
+            
+            if self.weekly_labels is not None:
+                self.weekly_labels[name] = new_label['id']
+                self.weekly_label_count += 1
+            return new_label['id']
     
-    def pull_cards_to_weekly(self):
-        """Pull all cards with 'This Week' label from ALL boards to Weekly board"""
+    async def plan_sync(self, boards: List[Dict], mappings: List[Dict], check_orphans: bool = True) -> SyncPlan:
+        """Read the labelled cards on the boards, the Weekly board and any other mapped cards, then plan"""
         logger.info("=" * 80)
-        logger.info("PULLING CARDS TO WEEKLY BOARD (SCANNING ALL BOARDS)")
+        logger.info("PLANNING SYNC")
         logger.info("=" * 80)
         
-        # Get all boards user has access to
-        all_boards = self.get_all_boards()
-        logger.info(f"\nFound {len(all_boards)} boards across all workspaces")
-        logger.info("Scanning for 'This Week' label...\n")
+        trigger_label = self.config['trigger_label']
+        logger.info(f"Scanning {len(boards)} board(s) for '{trigger_label}' label and {len(mappings)} mapped card(s) "
+                    f"({self.scan_concurrency} requests at a time)...\n")
         
-        boards_with_cards = 0
+        # The board reads don't depend on each other, so they all go out together
+        weekly_cards = asyncio.create_task(self.get_weekly_cards()) if check_orphans else None
+        # Labels only matter for copies, which only scanned boards can produce
+        weekly_labels = asyncio.create_task(self.load_weekly_labels()) if boards else None
+        board_cards = await self.scan_boards(boards)
+        if weekly_labels:
+            await weekly_labels
+        if weekly_cards:
+            weekly_cards = await weekly_cards
+        
+        # Every card read so far goes into the per-run cache, keyed by ID, so mapped cards
+        # found there aren't fetched again; only the rest (unlabelled, archived, on boards
+        # that weren't scanned, or deleted) are fetched, in batches
+        for cards in board_cards:
+            self.card_cache.update((card.id, card) for card in cards)
+        self.card_cache.update((card.id, card) for card in weekly_cards or ())
+        await self.prefetch_mapped_cards(mappings)
+        
+        # Results come back in board order, so the plan is deterministic
+        return self.reconcile(list(zip(boards, board_cards)), mappings, weekly_cards)
+    
+    async def scan_boards(self, boards: List[Dict]) -> List[List[CardSnapshot]]:
+        """Get the labelled cards on each board, in board order (split across worker processes when sharded)"""
+        if self.shards <= 1 or len(boards) <= 1:
+            board_cards = await self.scanner.scan([board['id'] for board in boards], self.scan_concurrency)
+        else:
+            board_cards = await self.scan_sharded(boards)
+        
+        # A board that couldn't be read adds no cards; its mapped cards are still fetched by ID
+        return [cards if cards is not None else [] for cards in board_cards]
+    
+    async def scan_sharded(self, boards: List[Dict]) -> List[Optional[List[CardSnapshot]]]:
+        """Scan the boards in worker processes, then rescan here any board a worker couldn't read"""
+        partitions = partition_boards(boards, self.shards, self.shard_by)
+        tokens = [
+            self.shard_tokens[number % len(self.shard_tokens)] if self.shard_tokens else self.api_token
+            for number in range(len(partitions))
+        ]
+        logger.info(f"Scanning in {len(partitions)} worker process(es), by {self.shard_by}")
+        
+        loop = asyncio.get_running_loop()
+        # Spawned rather than forked: the workers shouldn't inherit this process's event loop and connections
+        with ProcessPoolExecutor(len(partitions), mp_context=multiprocessing.get_context('spawn')) as pool:
+            results = await asyncio.gather(*(
+                loop.run_in_executor(
+                    pool, scan_shard, self.api_key, token, self.client_settings,
+                    self.config['trigger_label'], self.discovery_mode, self.scan_concurrency,
+                    [board['id'] for _, board in partition],
+                    # Extra tokens may belong to members who can't see every board
+                    token != self.api_token,
+                    1 / len(partitions), 1 / tokens.count(token)
+                )
+                for partition, token in zip(partitions, tokens)
+            ), return_exceptions=True)
+        
+        # Put every board's cards back in its original position, so the plan is the same as unsharded
+        board_cards: List[Optional[List[CardSnapshot]]] = [None] * len(boards)
+        for number, (partition, result) in enumerate(zip(partitions, results)):
+            if isinstance(result, BaseException):
+                logger.error(f"Shard {number} failed ({result})")
+                continue
+            shard_cards, errors, metrics = result
+            self.stats['errors'] += errors
+            # The workers' API calls show up in this run's metrics
+            self.client.metrics.merge(metrics)
+            logger.info(f"Shard {number}: {len(partition)} board(s), "
+                        f"{sum(len(cards) for cards in shard_cards if cards)} labelled card(s), "
+                        f"{sum(stats.count for stats in metrics.values())} API call(s)")
+            for (index, _), cards in zip(partition, shard_cards):
+                board_cards[index] = cards
+        
+        # Boards of a failed shard, boards a worker's token can't access and boards whose reads
+        # failed are scanned with this process's token, as an unsharded run would have
+        missing = [index for index, cards in enumerate(board_cards) if cards is None]
+        if missing:
+            logger.warning(f"Scanning {len(missing)} board(s) the workers couldn't read here instead")
+            rescanned = await self.scanner.scan([boards[index]['id'] for index in missing], self.scan_concurrency)
+            for index, cards in zip(missing, rescanned):
+                board_cards[index] = cards
+        return board_cards
+    
+    async def execute_plan(self, plan: SyncPlan):
+        """Apply a plan wave by wave; the writes within a wave go out concurrently"""
+        logger.info("\n" + "=" * 80)
+        logger.info(f"APPLYING SYNC PLAN ({len(plan)} write(s))")
+        logger.info("=" * 80)
         
-        for board in all_boards:
-            board_id = board['id']
-            board_name = board['name']
-            
-            logger.info(f"Scanning: {board_name}")
-            cards = self.get_cards_with_label(board_id, self.config['trigger_label'])
-            
-            if len(cards) > 0:
-                boards_with_cards += 1
-                logger.info(f"  ✓ Found {len(cards)} card(s) with '{self.config['trigger_label']}' label")
-                
-                # Get or create label for this board
-                label_id = self.get_or_create_project_label(board_name)
-                
-                # Create pseudo project_board object for compatibility
-                project_board = {
-                    'id': board_id,
-                    'name': board_name,
-                    'weekly_label_id': label_id
-                }
-                
-                for card in cards:
-                    self.copy_card_to_weekly(card, project_board)
+        # New labels one at a time, so they are given colors in plan order
+        trigger_label = self.config['trigger_label']
+        for name in plan.labels:
+            await self.get_or_create_weekly_label(name, color='orange' if name == trigger_label else None)
         
-        logger.info(f"\nScan complete: {boards_with_cards} boards had cards with 'This Week' label")
+        await self.gather_limited(self.apply_copy(copy) for copy in plan.copies)
+        await self.gather_limited(
+            [self.apply_move(move) for move in plan.moves]
+            + [self.apply_status_comment(comment) for comment in plan.comments]
+        )
+        await self.gather_limited(self.apply_removal(removal) for removal in plan.removals)
     
-    def sync_status_changes(self):
-        """Sync status changes between boards"""
-        logger.info("\n" + "=" * 80)
-        logger.info("SYNCING STATUS CHANGES")
+    async def apply_copy(self, copy: CopyCard):
+        """Copy a card to the Weekly board (and complete it if the original is archived)"""
+        project_board = {
+            'id': copy.board_id,
+            'name': copy.board_name,
+            'weekly_label_id': await self.get_or_create_project_label(copy.board_name)
+        }
+        new_card = await self.copy_card_to_weekly(copy.card, project_board)
+        if new_card and copy.complete:
+            await self.apply_move(MoveCard(new_card['id'], copy.card.name, self.config['lists']['completed']))
+    
+    async def apply_move(self, move: MoveCard):
+        """Move a Weekly board card to Completed"""
+        if await self.api_request('PUT', f"cards/{move.card_id}", params={'idList': move.list_id}) is not None:
+            if self.card_cache.get(move.card_id):
+                self.card_cache[move.card_id].idList = move.list_id
+        logger.info(f"Moved to completed (original closed): {move.name}")
+        self.stats['synced'] += 1
+    
+    async def apply_status_comment(self, comment: CommentOnCard):
+        """Tell the original card its Weekly card was completed"""
+        await self.api_request('POST', f"cards/{comment.card_id}/actions/comments", params={'text': comment.text})
+        logger.info(f"Synced completion: {comment.name}")
+        self.stats['synced'] += 1
+    
+    async def apply_removal(self, removal: RemoveCard):
+        """Delete a card from the Weekly board, comment on its original and drop its mapping"""
+        logger.info(f"Removing from Weekly board ({removal.reason}): {removal.name}")
+        if removal.weekly_card_id:
+            await self.api_request('DELETE', f"cards/{removal.weekly_card_id}")
+            self.card_cache[removal.weekly_card_id] = None
+        if removal.comment:
+            await self.api_request(
+                'POST', f"cards/{removal.comment.card_id}/actions/comments", params={'text': removal.comment.text}
+            )
+        if removal.mapping:
+            self.remove_mapping(weekly_card_id=removal.mapping['weekly_card_id'])
+        self.stats['removed'] += 1
+    
+    async def get_board_actions(self, board_id: str, since: str) -> Optional[List[Dict]]:
+        """Get card actions on a board since a checkpoint"""
+        return await self.api_request('GET', f'boards/{board_id}/actions', {
+            'filter': INCREMENTAL_ACTION_TYPES,
+            'since': since,
+            'limit': ACTIONS_LIMIT,
+            'fields': 'type,data,date'
+        })
+    
+    def needs_full_scan(self) -> bool:
+        """Full scan unless in incremental mode with a recent enough checkpoint and full scan"""
+        if self.sync_mode != 'incremental':
+            return True
+        if not self.mapping.get('last_checkpoint') or not self.mapping.get('last_full_scan'):
+            logger.info("No incremental checkpoint yet, running full scan")
+            return True
+        last_full_scan = datetime.fromisoformat(self.mapping['last_full_scan'].replace('Z', '+00:00'))
+        if datetime.now(timezone.utc) - last_full_scan >= self.full_scan_interval:
+            logger.info("Scheduled full scan is due")
+            return True
+        return False
+    
+    async def plan_incremental_sync(self, since: str) -> SyncPlan:
+        """Plan only for the cards touched by board actions since the last checkpoint"""
+        logger.info("=" * 80)
+        logger.info(f"INCREMENTAL SYNC (CHANGES SINCE {since})")
         logger.info("=" * 80)
         
-        for mapping in self.mapping['mappings']:
-            self.sync_card_status(mapping)
+        all_boards = await self.get_all_boards()
+        trigger_label = self.config['trigger_label']
+        boards = all_boards + [{'id': self.weekly_board_id, 'name': 'Weekly Milestone'}]
+        board_actions = await self.gather_limited(self.get_board_actions(board['id'], since) for board in boards)
+        weekly_actions = board_actions.pop()
+        
+        # Project boards: rescan boards where the trigger label was added (or whose actions
+        # we could not read completely) and re-check any mapped card that changed
+        boards_to_rescan = []
+        changed_mappings = {}
+        for board, actions in zip(all_boards, board_actions):
+            if actions is None or len(actions) >= ACTIONS_LIMIT:
+                boards_to_rescan.append(board)
+                changed_mappings.update({m['original_card_id']: m for m in self.mappings.by_board(board['id'])})
+                continue
+            # New, copied, moved-in or converted cards may carry the label already
+            if any(
+                (a['type'] == 'addLabelToCard' and a['data'].get('label', {}).get('name') == trigger_label)
+                or a['type'] in NEW_CARD_ACTION_TYPES
+                for a in actions
+            ):
+                boards_to_rescan.append(board)
+            for action in actions:
+                mapping = self.find_mapping(original_card_id=action['data'].get('card', {}).get('id'))
+                if mapping:
+                    changed_mappings[mapping['original_card_id']] = mapping
+        
+        # Weekly board: re-check mapped cards that changed there, and look for orphans
+        # (cards created by hand or unlabelled) if anything happened on it
+        if weekly_actions is None or len(weekly_actions) >= ACTIONS_LIMIT:
+            changed_mappings.update({m['original_card_id']: m for m in self.mappings})
+        else:
+            for action in weekly_actions:
+                mapping = self.find_mapping(weekly_card_id=action['data'].get('card', {}).get('id'))
+                if mapping:
+                    changed_mappings[mapping['original_card_id']] = mapping
+        
+        logger.info(f"{len(boards_to_rescan)} board(s) to rescan, {len(changed_mappings)} mapped card(s) changed")
+        
+        # Only read the Weekly board for the orphan check if anything happened on it
+        return await self.plan_sync(
+            boards_to_rescan,
+            list(changed_mappings.values()),
+            check_orphans=weekly_actions is None or bool(weekly_actions)
+        )
     
-    def run(self):
+    async def sync_card(self, card_id: str, board_id: str):
+        """Apply the copy/remove/complete logic to a single card (used by the webhook receiver)"""
+        trigger_label = self.config['trigger_label']
+        if board_id == self.weekly_board_id:
+            mapping = self.find_mapping(weekly_card_id=card_id)
+        else:
+            mapping = self.find_mapping(original_card_id=card_id)
+        
+        # Always work from fresh copies of the cards involved
+        card_ids = [card_id] + ([mapping['original_card_id'], mapping['weekly_card_id']] if mapping else [])
+        for cached_id in card_ids:
+            self.card_cache.pop(cached_id, None)
+        # Labels may have been edited on the Weekly board since the last event
+        async with self._weekly_label_lock:
+            self.weekly_labels = None
+
+        try:
+            # The same planner as a full run, over just this card
+            scan_results, mappings, weekly_cards = [], [], None
+            if mapping:
+                mappings = [mapping]
+                await self.prefetch_mapped_cards(mappings)
+            elif board_id == self.weekly_board_id:
+                card = await self.api_request('GET', f'cards/{card_id}', {'fields': WEEKLY_CARD_FIELDS})
+                weekly_cards = [CardSnapshot.from_api(card)] if card else None
+            else:
+                card = await self.api_request('GET', f'cards/{card_id}', {'fields': SCAN_CARD_FIELDS})
+                card = CardSnapshot.from_api(card) if card else None
+                if card and not card.closed and card.has_label(trigger_label):
+                    board = await self.api_request('GET', f'boards/{board_id}', {'fields': 'name'})
+                    if board:
+                        scan_results = [({'id': board_id, 'name': board['name']}, [card])]
+            
+            # The caller persists the mappings (the webhook receiver batches the writes)
+            await self.execute_plan(self.reconcile(scan_results, mappings, weekly_cards))
+        finally:
+            for cached_id in card_ids:
+                self.card_cache.pop(cached_id, None)
+    
+    async def run(self):
         """Main execution"""
         logger.info("╔" + "=" * 78 + "╗")
         logger.info("║" + " " * 20 + "WEEKLY MILESTONE SYNC STARTED" + " " * 29 + "║")
         logger.info("║" + f" {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ".center(78) + "║")
         logger.info("╚" + "=" * 78 + "╝")
         
+        # Cards and labels are re-read every run, but only once within it
+        self.card_cache = {}
+        self.scanner.board_label_cache = {}
+        self.weekly_labels = None
+        
+        # Actions from here on are picked up by the next incremental run
+        checkpoint = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        
         try:
-            # Step 1: Pull cards with "This Week" label
-            self.pull_cards_to_weekly()
+            await self.load_lists()
             
-            # Step 2: Sync status changes
-            self.sync_status_changes()
+            full_scan = self.needs_full_scan()
+            if full_scan:
+                # Every board, every mapping and the whole Weekly board (for orphans)
+                boards = await self.get_all_boards()
+                logger.info(f"Found {len(boards)} boards across all workspaces")
+                plan = await self.plan_sync(boards, list(self.mappings))
+            else:
+                plan = await self.plan_incremental_sync(self.mapping['last_checkpoint'])
             
-            # Step 3: Cleanup removed labels
-            self.cleanup_removed_labels()
+            if self.dry_run:
+                logger.info("\n" + "=" * 80)
+                logger.info(f"DRY RUN: {len(plan)} planned write(s), nothing was changed")
+                logger.info("=" * 80)
+                for line in plan.describe():
+                    logger.info(f"  {line}")
+                return
             
-            # Step 4: Cleanup orphaned cards (cards on Weekly board not in mapping)
-            self.cleanup_orphaned_cards()
+            errors_before = self.stats['errors']
+            await self.execute_plan(plan)
+            # A write that failed is only retried if the next run looks at these changes again,
+            # so the checkpoint (and the full-scan time) only move on after a clean apply
+            if self.stats['errors'] == errors_before:
+                if full_scan:
+                    self.mapping['last_full_scan'] = checkpoint
+                self.mapping['last_checkpoint'] = checkpoint
+            else:
+                logger.warning("Some changes failed to apply; the next run starts from the previous checkpoint")
             
             # Save mapping
             self.save_mapping()
@@ -453,9 +901,16 @@ class TrelloWeeklySync:
             logger.info(f"Status Synced: {self.stats['synced']}")
             logger.info(f"Cards Removed: {self.stats['removed']}")
             logger.info(f"Errors: {self.stats['errors']} (404 errors for deleted cards are expected)")
-            logger.info(f"Total Mapped Cards: {len(self.mapping['mappings'])}")
+            logger.info(f"Total Mapped Cards: {len(self.mappings)}")
             logger.info("=" * 80)
             
+            # Machine-readable summary: per-endpoint API latency, statuses, bytes, retries, rate-limit waits
+            logger.info("RUN METRICS " + json.dumps({
+                'stats': self.stats,
+                'mapped_cards': len(self.mappings),
+                'api': self.client.metrics.summary()
+            }))
+            
             # Note: 404 errors (card not found) are expected during cleanup
             # Only exit with error if there were actual failures
         
@@ -464,7 +919,94 @@ class TrelloWeeklySync:
             sys.exit(1)
 
 
+def scan_shard(
+    api_key: str,
+    api_token: str,
+    client_settings: Dict,
+    label_name: str,
+    discovery_mode: str,
+    concurrency: int,
+    board_ids: List[str],
+    check_access: bool,
+    key_share: float,
+    token_share: float
+) -> Tuple[List[Optional[List[CardSnapshot]]], int, Dict[str, EndpointStats]]:
+    """Worker process: get the labelled cards on one shard's boards (None for a board it couldn't read)"""
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s', stream=sys.stdout)
+    
+    async def scan():
+        # Only a client: the config, the mappings and every write stay with the coordinator
+        metrics = MetricsRegistry()
+        client = build_client(api_key, api_token, client_settings, metrics)
+        client.rate_limiter.share(key_share, token_share)
+        errors = 0
+        
+        async def request(method: str, endpoint: str, params: Dict = None) -> Optional[Dict]:
+            nonlocal errors
+            try:
+                return await client.request(method, f'/{endpoint}', params=params)
+            except (httpx.HTTPError, ValueError) as e:
+                logger.error(f"API request failed: {e}")
+                errors += 1
+                return None
+        
+        try:
+            readable = board_ids
+            if check_access:
+                # Boards this token can't see are left for the coordinator to scan
+                boards = await request('GET', 'members/me/boards', {'fields': 'id'})
+                accessible = {board['id'] for board in boards or ()}
+                readable = [board_id for board_id in board_ids if board_id in accessible]
+            
+            scanner = BoardScanner(request, label_name, discovery_mode)
+            cards = dict(zip(readable, await scanner.scan(readable, concurrency)))
+            # The metrics go back as raw counters, so the coordinator can add them to its own
+            return [cards.get(board_id) for board_id in board_ids], errors, metrics.export()
+        finally:
+            await client.close()
+    
+    return asyncio.run(scan())
+
+
+def setup_logging():
+    """Log to a timestamped file under logs/ and to stdout"""
+    log_dir = os.path.join(os.path.dirname(__file__), 'logs')
+    os.makedirs(log_dir, exist_ok=True)
+    
+    log_file = os.path.join(log_dir, f'weekly_sync_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_file),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+
+
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Sync "This Week" cards to the Weekly Milestone board')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--incremental', action='store_const', const='incremental', dest='sync_mode',
+                      help='only process cards changed since the last run (falls back to a full scan when due)')
+    mode.add_argument('--full', action='store_const', const='full', dest='sync_mode',
+                      help='rescan all boards and mappings')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='print the planned changes without making them (the mapping file is left untouched)')
+    args = parser.parse_args()
+    
+    setup_logging()
     sync = TrelloWeeklySync()
-    sync.run()
+    if args.sync_mode:
+        sync.sync_mode = args.sync_mode
+    sync.dry_run = args.dry_run
+    
+    async def main():
+        try:
+            await sync.run()
+        finally:
+            await sync.close()
+    
+    asyncio.run(main())
 
@@ -0,0 +1,3 @@
+"""
+Supporting components for the Weekly Milestone board sync (weekly_milestone_sync.py).
+"""
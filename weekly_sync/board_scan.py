@@ -0,0 +1,97 @@
+"""
+Finding the cards that carry the trigger label on project boards.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from weekly_sync.card_snapshot import CardSnapshot
+
+# Card fields read from project boards; everything else stays on the server
+SCAN_CARD_FIELDS = 'id,name,idList,labels,due,closed,idMembers,shortUrl'
+
+# Trello search returns at most 1000 cards per query
+SEARCH_CARDS_LIMIT = 1000
+
+# Makes one Trello API call: (method, endpoint, params) -> response body, or None if it failed
+Request = Callable[[str, str, Dict], Awaitable[Optional[Any]]]
+
+
+class BoardScanner:
+    """
+    Gets the cards carrying one label on project boards.
+
+    'search' mode asks Trello's search for the labelled cards and falls back to
+    the whole board when search fails or may be truncated; 'board' mode always
+    downloads every card on the board. A board whose cards couldn't be read
+    gives None rather than an empty list, so callers can tell it apart from a
+    board without labelled cards.
+    """
+
+    def __init__(self, request: Request, label_name: str, discovery_mode: str = 'search'):
+        self.request = request
+        self.label_name = label_name
+        self.discovery_mode = discovery_mode
+        # IDs of the label on each board (None = lookup failed), looked up once per run
+        self.board_label_cache: Dict[str, Optional[List[str]]] = {}
+
+    async def scan(self, board_ids: List[str], concurrency: int) -> List[Optional[List[CardSnapshot]]]:
+        """Get the labelled cards on each board, at most `concurrency` boards at a time, in board order"""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def limited(board_id: str) -> Optional[List[CardSnapshot]]:
+            async with semaphore:
+                return await self.get_cards_with_label(board_id)
+
+        return await asyncio.gather(*(limited(board_id) for board_id in board_ids))
+
+    async def get_board_label_ids(self, board_id: str) -> Optional[List[str]]:
+        """Get the IDs of the labels with this name on a board (looked up once per run)"""
+        if board_id not in self.board_label_cache:
+            labels = await self.request('GET', f'boards/{board_id}/labels', {'fields': 'name', 'limit': 1000})
+            self.board_label_cache[board_id] = (
+                None if labels is None else [label['id'] for label in labels if label.get('name') == self.label_name]
+            )
+        return self.board_label_cache[board_id]
+
+    async def get_cards_with_label(self, board_id: str) -> Optional[List[CardSnapshot]]:
+        """Get all cards on a board with the label (None if the board couldn't be read)"""
+        if self.discovery_mode != 'search':
+            return await self.scan_board_for_label(board_id)
+
+        label_ids = await self.get_board_label_ids(board_id)
+        if label_ids is None:
+            return await self.scan_board_for_label(board_id)
+        if not label_ids:
+            # No such label on this board, so no card can have it
+            return []
+
+        result = await self.request('GET', 'search', {
+            # Search includes archived cards unless told otherwise; board reads and webhooks don't
+            'query': f'label:"{self.label_name}" is:open',
+            'idBoards': board_id,
+            'modelTypes': 'cards',
+            'card_fields': SCAN_CARD_FIELDS,
+            'cards_limit': SEARCH_CARDS_LIMIT,
+            'partial': 'false'
+        })
+        if result is None or len(result.get('cards', [])) >= SEARCH_CARDS_LIMIT:
+            # Search failed or may be truncated; fall back to the full board
+            return await self.scan_board_for_label(board_id)
+
+        # Search matching is fuzzy, so keep only open cards that carry this board's exact label
+        label_ids = set(label_ids)
+        cards = (CardSnapshot.from_api(card) for card in result.get('cards', []))
+        return [card for card in cards if not card.closed and not label_ids.isdisjoint(card.label_ids)]
+
+    async def scan_board_for_label(self, board_id: str) -> Optional[List[CardSnapshot]]:
+        """Download every card on a board and filter by label name (None if the board couldn't be read)"""
+        cards = await self.request('GET', f'boards/{board_id}/cards', {'fields': SCAN_CARD_FIELDS})
+        if cards is None:
+            return None
+
+        # Only the matching cards are kept, as compact snapshots
+        return [
+            CardSnapshot.from_api(card) for card in cards
+            if any(label.get('name') == self.label_name for label in card.get('labels', []))
+        ]
@@ -0,0 +1,69 @@
+"""
+Compact in-memory representation of the cards the sync reads.
+"""
+
+from typing import Dict, Optional, Tuple
+
+# Label names and IDs repeat across thousands of cards; one shared copy of each
+_interned: Dict[str, str] = {}
+
+
+def intern_label(value: str) -> str:
+    """Return the shared copy of a label name or ID"""
+    return _interned.setdefault(value, value)
+
+
+class CardSnapshot:
+    """
+    The fields of a Trello card the sync uses, and nothing else.
+
+    Slotted (no per-instance dict) with labels reduced to tuples of interned
+    names and IDs, so a full-account scan stays small. Attribute names follow
+    the Trello API fields they come from.
+    """
+
+    __slots__ = ('id', 'name', 'idList', 'label_ids', 'label_names', 'due', 'closed', 'idMembers', 'shortUrl')
+
+    def __init__(
+        self,
+        id: str,
+        name: str = '',
+        idList: Optional[str] = None,
+        label_ids: Tuple[str, ...] = (),
+        label_names: Tuple[str, ...] = (),
+        due: Optional[str] = None,
+        closed: bool = False,
+        idMembers: Tuple[str, ...] = (),
+        shortUrl: str = '',
+    ):
+        self.id = id
+        self.name = name
+        self.idList = idList
+        self.label_ids = label_ids
+        self.label_names = label_names
+        self.due = due
+        self.closed = closed
+        self.idMembers = idMembers
+        self.shortUrl = shortUrl
+
+    @classmethod
+    def from_api(cls, card: Dict) -> 'CardSnapshot':
+        """Build a snapshot from a card returned by the Trello API"""
+        labels = card.get('labels') or ()
+        return cls(
+            id=card['id'],
+            name=card.get('name', ''),
+            idList=card.get('idList'),
+            label_ids=tuple(intern_label(label['id']) for label in labels if label.get('id')),
+            label_names=tuple(intern_label(label.get('name') or '') for label in labels),
+            due=card.get('due'),
+            closed=card.get('closed', False),
+            idMembers=tuple(card.get('idMembers') or ()),
+            shortUrl=card.get('shortUrl') or card.get('url', ''),
+        )
+
+    def has_label(self, name: str) -> bool:
+        return name in self.label_names
+
+    def __repr__(self) -> str:
+        return f'CardSnapshot(id={self.id!r}, name={self.name!r})'
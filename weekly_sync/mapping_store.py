@@ -0,0 +1,276 @@
+"""
+Storage for original card <-> Weekly board card mappings.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class MappingIndex:
+    """
+    In-memory mapping store indexed by both original and weekly card ID.
+
+    Lookup, insert and delete are O(1). Entries keep their insertion order so
+    `to_list()` round-trips the `mappings` list of weekly_sync_mapping.json.
+    """
+
+    def __init__(self, mappings: Iterable[Dict] = ()):
+        self._by_original: Dict[str, Dict] = {}
+        self._weekly_to_original: Dict[str, str] = {}
+        for mapping in mappings:
+            # Keep the first entry for a card, like the old linear scan did
+            if mapping['original_card_id'] not in self._by_original:
+                self.add(mapping)
+
+    def __len__(self) -> int:
+        return len(self._by_original)
+
+    def __iter__(self) -> Iterator[Dict]:
+        # Iterate over a snapshot so callers can add/remove while looping
+        return iter(list(self._by_original.values()))
+
+    def get(self, original_card_id: str = None, weekly_card_id: str = None) -> Optional[Dict]:
+        """Find a mapping by original card ID or weekly card ID"""
+        if original_card_id and original_card_id in self._by_original:
+            return self._by_original[original_card_id]
+        if weekly_card_id and weekly_card_id in self._weekly_to_original:
+            return self._by_original[self._weekly_to_original[weekly_card_id]]
+        return None
+
+    def add(self, mapping: Dict):
+        """Insert a mapping, replacing any entry for the same original card"""
+        self.remove(original_card_id=mapping['original_card_id'])
+        self._by_original[mapping['original_card_id']] = mapping
+        self._weekly_to_original[mapping['weekly_card_id']] = mapping['original_card_id']
+
+    def remove(self, original_card_id: str = None, weekly_card_id: str = None) -> List[Dict]:
+        """Remove mappings matching either ID and return them"""
+        removed = []
+        if weekly_card_id and weekly_card_id in self._weekly_to_original:
+            removed.append(self._pop(self._weekly_to_original[weekly_card_id]))
+        if original_card_id and original_card_id in self._by_original:
+            removed.append(self._pop(original_card_id))
+        return removed
+
+    def _pop(self, original_card_id: str) -> Dict:
+        mapping = self._by_original.pop(original_card_id)
+        self._weekly_to_original.pop(mapping['weekly_card_id'], None)
+        return mapping
+
+    def by_board(self, original_board_id: str) -> List[Dict]:
+        """All mappings whose original card lives on the given board"""
+        return [m for m in self._by_original.values() if m.get('original_board_id') == original_board_id]
+
+    def weekly_card_ids(self) -> Set[str]:
+        return set(self._weekly_to_original)
+
+    def to_list(self) -> List[Dict]:
+        return list(self._by_original.values())
+
+
+class JsonMappingStore(MappingIndex):
+    """
+    Mappings kept in memory and written to weekly_sync_mapping.json as a whole on save().
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        data = self._read()
+        super().__init__(data.pop('mappings', []))
+        # Everything else in the file (e.g. last_updated) is run metadata
+        self.metadata: Dict = data
+
+    def _read(self) -> Dict:
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {'last_updated': None}
+        except json.JSONDecodeError:
+            logger.warning("Invalid mapping file, starting fresh")
+            return {'last_updated': None}
+
+    def save(self):
+        self.prepare_save()()
+
+    def prepare_save(self) -> Callable[[], None]:
+        """Capture the current mappings and return a function that writes them (safe to run in a thread)"""
+        data = {'mappings': self.to_list(), **self.metadata}
+
+        def write():
+            # Written to a temporary file first so a crash mid-write keeps the previous file
+            tmp_path = f'{self.path}.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+        return write
+
+    def close(self):
+        pass
+
+
+class SQLiteMappingStore:
+    """
+    Mappings persisted in a WAL-mode SQLite database.
+
+    Every add/remove is its own transaction, so a crash mid-run keeps every
+    mapping written so far and write cost is proportional to the changes.
+    Has the same interface as JsonMappingStore.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS mappings (
+            original_card_id TEXT PRIMARY KEY,
+            weekly_card_id TEXT NOT NULL,
+            original_board_id TEXT,
+            original_list_id TEXT,
+            synced_at TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_mappings_weekly_card ON mappings (weekly_card_id);
+        CREATE INDEX IF NOT EXISTS idx_mappings_original_board ON mappings (original_board_id);
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+    COLUMNS = ('original_card_id', 'weekly_card_id', 'original_board_id', 'original_list_id', 'synced_at')
+
+    def __init__(self, path: str):
+        self.path = path
+        # The sync may touch the store from worker threads; writes are serialized by the lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.executescript(self.SCHEMA)
+        stored = self._read_meta()
+        self.metadata: Dict = {'last_updated': None, **stored}
+        # The stored value of each key, so a save only writes the keys this process changed;
+        # another process (the cron sync vs. the webhook server) may have saved others since
+        self._saved_meta: Dict[str, str] = {key: json.dumps(value) for key, value in stored.items()}
+
+    def _read_meta(self) -> Dict:
+        with self._lock:
+            rows = self._conn.execute('SELECT key, value FROM meta').fetchall()
+        return {row['key']: json.loads(row['value']) for row in rows}
+
+    def _query(self, sql: str, params: tuple = ()) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM mappings').fetchone()[0]
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self.to_list())
+
+    def get(self, original_card_id: str = None, weekly_card_id: str = None) -> Optional[Dict]:
+        """Find a mapping by original card ID or weekly card ID"""
+        if original_card_id:
+            rows = self._query('SELECT * FROM mappings WHERE original_card_id = ?', (original_card_id,))
+            if rows:
+                return rows[0]
+        if weekly_card_id:
+            rows = self._query('SELECT * FROM mappings WHERE weekly_card_id = ? LIMIT 1', (weekly_card_id,))
+            if rows:
+                return rows[0]
+        return None
+
+    def by_board(self, original_board_id: str) -> List[Dict]:
+        """All mappings whose original card lives on the given board"""
+        return self._query(
+            'SELECT * FROM mappings WHERE original_board_id = ? ORDER BY rowid', (original_board_id,)
+        )
+
+    def add(self, mapping: Dict):
+        """Upsert a mapping in its own transaction"""
+        self.add_many([mapping])
+
+    def add_many(self, mappings: Iterable[Dict]):
+        """Upsert several mappings in one transaction"""
+        rows = [tuple(m.get(column) for column in self.COLUMNS) for m in mappings]
+        with self._lock, self._conn:
+            # Delete first so a replaced mapping moves to the end, like MappingIndex.add
+            self._conn.executemany('DELETE FROM mappings WHERE original_card_id = ?', [(row[0],) for row in rows])
+            self._conn.executemany(
+                f"INSERT INTO mappings ({', '.join(self.COLUMNS)}) VALUES ({', '.join('?' * len(self.COLUMNS))})",
+                rows,
+            )
+
+    def remove(self, original_card_id: str = None, weekly_card_id: str = None) -> List[Dict]:
+        """Delete mappings matching either ID in one transaction and return them"""
+        removed = self._query(
+            'SELECT * FROM mappings WHERE original_card_id = ? OR weekly_card_id = ?',
+            (original_card_id, weekly_card_id),
+        )
+        if removed:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    'DELETE FROM mappings WHERE original_card_id = ? OR weekly_card_id = ?',
+                    (original_card_id, weekly_card_id),
+                )
+        return removed
+
+    def weekly_card_ids(self) -> Set[str]:
+        with self._lock:
+            return {row[0] for row in self._conn.execute('SELECT weekly_card_id FROM mappings')}
+
+    def to_list(self) -> List[Dict]:
+        return self._query('SELECT * FROM mappings ORDER BY rowid')
+
+    def save(self):
+        """Persist run metadata; mappings are already written as they change"""
+        self.prepare_save()()
+
+    def prepare_save(self) -> Callable[[], None]:
+        """Capture the changed run metadata and return a function that writes it (safe to run in a thread)"""
+        rows = [
+            (key, value) for key, value in ((key, json.dumps(value)) for key, value in self.metadata.items())
+            if self._saved_meta.get(key) != value
+        ]
+
+        def write():
+            with self._lock, self._conn:
+                self._conn.executemany('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', rows)
+            self._saved_meta.update(rows)
+
+        return write
+
+    def migrate_from_json(self, json_path: str) -> int:
+        """One-shot import of an existing weekly_sync_mapping.json; returns the number of mappings imported"""
+        if self.metadata.get('migrated_from_json') or not os.path.exists(json_path):
+            return 0
+        legacy = JsonMappingStore(json_path)
+        self.add_many(legacy.to_list())
+        if self.metadata.get('last_updated') is None:
+            self.metadata['last_updated'] = legacy.metadata.get('last_updated')
+        self.metadata['migrated_from_json'] = json_path
+        self.save()
+        logger.info(f"Migrated {len(legacy)} mappings from {json_path} to {self.path}")
+        return len(legacy)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def open_mapping_store(backend: str, json_path: str, db_path: str):
+    """Open the configured mapping store ('json' or 'sqlite')"""
+    if backend == 'sqlite':
+        store = SQLiteMappingStore(db_path)
+        store.migrate_from_json(json_path)
+        return store
+    if backend != 'json':
+        raise ValueError(f"Unknown mapping backend: {backend}")
+    return JsonMappingStore(json_path)
@@ -0,0 +1,39 @@
+"""
+Splitting the board scan of a sync run across worker processes.
+"""
+
+import hashlib
+from typing import Dict, List, Tuple
+
+SHARD_BY = ('organization', 'hash')
+
+
+def board_hash(board_id: str) -> int:
+    """Stable hash of a board ID (the built-in hash() changes between processes)"""
+    return int(hashlib.md5(board_id.encode()).hexdigest(), 16)
+
+
+def partition_boards(boards: List[Dict], shards: int, shard_by: str = 'organization') -> List[List[Tuple[int, Dict]]]:
+    """
+    Split boards into at most `shards` non-empty groups of (position in `boards`, board).
+
+    'organization' keeps each workspace's boards together, placing the largest
+    workspaces first, each on the least loaded shard; 'hash' spreads boards by
+    ID. Each group keeps the boards' original order.
+    """
+    if shard_by not in SHARD_BY:
+        raise ValueError(f"Unknown shard_by: {shard_by}")
+
+    partitions: List[List[Tuple[int, Dict]]] = [[] for _ in range(max(1, shards))]
+    if shard_by == 'hash':
+        for index, board in enumerate(boards):
+            partitions[board_hash(board['id']) % len(partitions)].append((index, board))
+    else:
+        # Personal boards (no workspace) count as one workspace
+        workspaces: Dict[str, List[Tuple[int, Dict]]] = {}
+        for index, board in enumerate(boards):
+            workspaces.setdefault(board.get('idOrganization') or '', []).append((index, board))
+        for group in sorted(workspaces.values(), key=len, reverse=True):
+            min(partitions, key=len).extend(group)
+
+    return [sorted(partition, key=lambda item: item[0]) for partition in partitions if partition]
@@ -0,0 +1,78 @@
+"""
+The writes a sync run will make, decided from its reads before any of them is made.
+"""
+
+from typing import Dict, List, NamedTuple, Optional
+
+from weekly_sync.card_snapshot import CardSnapshot
+
+
+class CopyCard(NamedTuple):
+    """Copy a labelled project card to the Weekly board"""
+    card: CardSnapshot
+    board_id: str
+    board_name: str
+    # The original is already archived, so the copy goes straight to Completed
+    complete: bool = False
+
+
+class MoveCard(NamedTuple):
+    """Move a Weekly board card to another list"""
+    card_id: str
+    name: str
+    list_id: str
+
+
+class CommentOnCard(NamedTuple):
+    """Add a comment to a card"""
+    card_id: str
+    name: str
+    text: str
+
+
+class RemoveCard(NamedTuple):
+    """Take a card off the Weekly board and drop its mapping"""
+    # None when the Weekly card is already gone and only the mapping is left
+    weekly_card_id: Optional[str]
+    name: str
+    reason: str
+    # None for orphans, which were never mapped
+    mapping: Optional[Dict] = None
+    comment: Optional[CommentOnCard] = None
+
+
+class SyncPlan:
+    """
+    Every write of one sync run, grouped into the waves they are applied in.
+
+    Labels are created first (one at a time, so new labels get their colors
+    in a stable order), then cards are copied, then moves and comments go out,
+    then removals. Writes within a wave don't depend on each other.
+    """
+
+    def __init__(self):
+        # Weekly board labels the copies need that aren't known to exist yet
+        self.labels: List[str] = []
+        self.copies: List[CopyCard] = []
+        self.moves: List[MoveCard] = []
+        self.comments: List[CommentOnCard] = []
+        self.removals: List[RemoveCard] = []
+
+    def __len__(self) -> int:
+        return len(self.labels) + len(self.copies) + len(self.moves) + len(self.comments) + len(self.removals)
+
+    def describe(self) -> List[str]:
+        """One line per planned write, in the order they would be made"""
+        lines = [f"Create Weekly board label '{name}'" for name in self.labels]
+        lines.extend(
+            f"Copy '{copy.card.name}' from {copy.board_name}" + (" (to Completed, original archived)" if copy.complete else "")
+            for copy in self.copies
+        )
+        lines.extend(f"Move '{move.name}' to Completed" for move in self.moves)
+        lines.extend(f"Comment on '{comment.name}': {comment.text}" for comment in self.comments)
+        for removal in self.removals:
+            action = f"Delete '{removal.name}'" if removal.weekly_card_id else f"Unmap '{removal.name}'"
+            lines.append(f"{action} ({removal.reason})")
+            if removal.comment:
+                lines.append(f"Comment on '{removal.comment.name}': {removal.comment.text}")
+        return lines